@@ -1,19 +1,59 @@
 # services/docx_service.py
+import asyncio
 import os
-import uuid
+import re
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from io import BytesIO
+from itertools import count
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
-from docx.shared import Inches
+from docx.shared import Emu, Inches
+from lxml.etree import SubElement
 from sqlalchemy.orm import Session
 
 from models.artifacts import Artifact
 
+# Directory generated documents are written to
+OUTPUT_DIR = "generated_docs"
+
+# Section types whose content comes from an Artifact row
+ARTIFACT_SECTION_TYPES = ("table", "image", "attachment")
+
+# Resolved once at import rather than on every element built
+_QN_ID = qn('w:id')
+_QN_NAME = qn('w:name')
+_QN_FLDCHARTYPE = qn('w:fldCharType')
+_QN_VAL = qn('w:val')
+_QN_TYPE = qn('w:type')
+_QN_W = qn('w:w')
+_QN_TBLPR = qn('w:tblPr')
+_QN_TBLSTYLE = qn('w:tblStyle')
+_QN_TBLW = qn('w:tblW')
+_QN_TBLGRID = qn('w:tblGrid')
+_QN_GRIDCOL = qn('w:gridCol')
+_QN_TR = qn('w:tr')
+_QN_TC = qn('w:tc')
+_QN_P = qn('w:p')
+_QN_R = qn('w:r')
+_QN_T = qn('w:t')
+_QN_TAB = qn('w:tab')
+_QN_BR = qn('w:br')
+_XML_SPACE_PRESERVE = {'{http://www.w3.org/XML/1998/namespace}space': 'preserve'}
+# Run text characters python-docx writes as <w:tab/> / <w:br/> elements
+_RUN_SPECIAL_CHARS = re.compile(r'([\t\n\r])')
+_BM_START = 'w:bookmarkStart'
+_BM_END = 'w:bookmarkEnd'
+
+# Fallback bookmark id source for helpers called outside generate_docx_document
+_bm_counter = count(1)
+
 
 async def generate_docx_document(document_data: Dict[str, Any], db: Session) -> str:
     """
@@ -28,6 +68,8 @@ async def generate_docx_document(document_data: Dict[str, Any], db: Session) ->
     """
     # Create new Document
     doc = Document()
+    # Bookmark ids only need to be unique within one document
+    bookmark_ids = count(1)
     
     # Add document title
     title = doc.add_heading(document_data["title"], level=0)
@@ -37,33 +79,49 @@ async def generate_docx_document(document_data: Dict[str, Any], db: Session) ->
     toc_bookmark = None
     for section in document_data["sections"]:
         if section["type"] == "tableOfContents":
-            toc_bookmark = add_toc(doc)
+            toc_bookmark = add_toc(doc, bookmark_ids)
             doc.add_paragraph()  # Add space after TOC
             break
     
-    # Process each section
-    for section in document_data["sections"]:
-        if section["type"] == "tableOfContents":
-            # Already handled above
-            continue
-        elif section["type"] == "paragraph":
-            add_paragraph_section(doc, section)
-        elif section["type"] == "table":
-            await add_table_section(doc, section, db)
-        elif section["type"] == "image":
-            await add_image_section(doc, section, db)
-        elif section["type"] == "attachment":
-            await add_attachment_section(doc, section, db)
+    # Fetch every referenced artifact in a single query
+    artifact_ids = {
+        section["artifactId"]
+        for section in document_data["sections"]
+        if section["type"] in ARTIFACT_SECTION_TYPES and section.get("artifactId")
+    }
+    artifacts = {}
+    if artifact_ids:
+        artifacts = {
+            artifact.id: artifact
+            for artifact in db.query(Artifact).filter(Artifact.id.in_(artifact_ids)).all()
+        }
+    
+    # Gather the I/O-bound preparation of every section concurrently, then
+    # mutate the Document in a single ordered pass
+    plans = await asyncio.gather(
+        *(prepare_section(section, artifacts) for section in document_data["sections"])
+    )
+    render_plans(doc, plans, bookmark_ids)
     
     # Create a temporary file for the document
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     file_name = f"{document_data['title'].replace(' ', '_')}_{timestamp}.docx"
-    output_dir = "generated_docs"
-    os.makedirs(output_dir, exist_ok=True)
-    file_path = os.path.join(output_dir, file_name)
+    file_path = os.path.join(OUTPUT_DIR, file_name)
     
-    # Save the document
-    doc.save(file_path)
+    # Save to a temp file and swap it in, so readers never see a partial
+    # document; both steps run off the event loop
+    tmp_path = f"{file_path}.tmp"
+    try:
+        await asyncio.to_thread(doc.save, tmp_path)
+        await asyncio.to_thread(os.replace, tmp_path, file_path)
+    except Exception:
+        # Don't leave a half-written temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
     
     # Update TOC if needed
     if toc_bookmark:
@@ -71,28 +129,33 @@ async def generate_docx_document(document_data: Dict[str, Any], db: Session) ->
     
     return file_path
 
-def add_paragraph_section(doc: Document, section: Dict[str, Any]) -> None:
+def add_paragraph_section(
+    doc: Document,
+    section: Dict[str, Any],
+    bookmark_ids: Optional[Iterator[int]] = None
+) -> None:
     """Add a paragraph section to the document."""
     # Add heading based on first line of text
     text = section["content"].strip()
-    first_line = text.split('\n')[0]
+    lines = text.split('\n', 1)
+    first_line = lines[0]
+    remaining_text = lines[1] if len(lines) > 1 else ''
     
     # Use the first line as a heading if it's relatively short
     if len(first_line) <= 100:
         heading = doc.add_heading(first_line, level=1)
         # Add bookmark for TOC
-        bookmark_start = OxmlElement('w:bookmarkStart')
-        bookmark_start.set(qn('w:id'), str(uuid.uuid4())[:8])
-        bookmark_start.set(qn('w:name'), f"heading_{section['id']}")
+        bookmark_start = OxmlElement(_BM_START)
+        bookmark_start.set(_QN_ID, str(next(bookmark_ids or _bm_counter)))
+        bookmark_start.set(_QN_NAME, f"heading_{section['id']}")
         heading._element.append(bookmark_start)
         
-        bookmark_end = OxmlElement('w:bookmarkEnd')
-        bookmark_end.set(qn('w:id'), bookmark_start.get(qn('w:id')))
+        bookmark_end = OxmlElement(_BM_END)
+        bookmark_end.set(_QN_ID, bookmark_start.get(_QN_ID))
         heading._element.append(bookmark_end)
         
         # Add the rest of the paragraph if there's more text
-        if len(text.split('\n')) > 1:
-            remaining_text = '\n'.join(text.split('\n')[1:])
+        if remaining_text:
             p = doc.add_paragraph(remaining_text)
     else:
         # Add the entire text as a regular paragraph
@@ -100,16 +163,49 @@ def add_paragraph_section(doc: Document, section: Dict[str, Any]) -> None:
     
     doc.add_paragraph()  # Add space after paragraph
 
-async def add_table_section(doc: Document, section: Dict[str, Any], db: Session) -> None:
-    """Add a table section to the document."""
-    # Add heading for table
-    heading = doc.add_heading(section["title"], level=2)
+async def prepare_section(section: Dict[str, Any], artifacts: Dict[str, Artifact]) -> Dict[str, Any]:
+    """
+    Build the render plan for a section
+    
+    Plans carry everything rendering needs (table rows, image bytes, ...)
+    so render_plans never blocks on I/O.
+    
+    Args:
+        section: Section data from the formatted document
+        artifacts: Prefetched artifacts keyed by id
+        
+    Returns:
+        Render plan dict; "message" is set when the section cannot be rendered,
+        "error" when reading its file failed
+    """
+    artifact = artifacts.get(section.get("artifactId"))
+    if section["type"] == "table":
+        return await prepare_table_section(section, artifact)
+    elif section["type"] == "image":
+        return await prepare_image_section(section, artifact)
+    elif section["type"] == "attachment":
+        return await prepare_attachment_section(section, artifact)
+    return {"type": section["type"], "section": section}
+
+def render_plans(doc: Document, plans: List[Dict[str, Any]], bookmark_ids: Optional[Iterator[int]] = None) -> None:
+    """Render prepared section plans into the document in declaration order."""
+    for plan in plans:
+        if plan["type"] == "paragraph":
+            add_paragraph_section(doc, plan["section"], bookmark_ids)
+        elif plan["type"] == "table":
+            render_table_section(doc, plan)
+        elif plan["type"] == "image":
+            render_image_section(doc, plan)
+        elif plan["type"] == "attachment":
+            render_attachment_section(doc, plan)
+
+async def prepare_table_section(section: Dict[str, Any], artifact: Optional[Artifact]) -> Dict[str, Any]:
+    """Load and stringify the rows of a table section."""
+    plan = {"type": "table", "title": section["title"]}
     
-    # Fetch the artifact data
-    artifact = db.query(Artifact).filter(Artifact.id == section["artifactId"]).first()
     if not artifact:
-        doc.add_paragraph("Table data not found")
-        return
+        plan["message"] = "Table data not found"
+        return plan
     
     if artifact.data:
         # Create table from artifact data
@@ -124,87 +220,164 @@ async def add_table_section(doc: Document, section: Dict[str, Any], db: Session)
             rows = table_data
         else:
             # Fallback for unknown format
-            doc.add_paragraph("Invalid table data format")
-            return
+            plan["message"] = "Invalid table data format"
+            return plan
         
         if not rows:
-            doc.add_paragraph("Table is empty")
-            return
+            plan["message"] = "Table is empty"
+            return plan
         
         # Get column headers
         if isinstance(rows[0], dict):
             # Data is a list of dictionaries
             headers = list(rows[0].keys())
-            table = doc.add_table(rows=len(rows) + 1, cols=len(headers))
-            
-            # Add headers
-            header_cells = table.rows[0].cells
-            for i, header in enumerate(headers):
-                header_cells[i].text = str(header)
-            
-            # Add data rows
-            for row_idx, row_data in enumerate(rows):
-                cells = table.rows[row_idx + 1].cells
-                for col_idx, header in enumerate(headers):
-                    cells[col_idx].text = str(row_data.get(header, ""))
+            table_rows = [[str(header) for header in headers]]
+            table_rows.extend(
+                [str(row_data.get(header, "")) for header in headers]
+                for row_data in rows
+            )
         elif isinstance(rows[0], list):
             # Data is a list of lists
-            table = doc.add_table(rows=len(rows), cols=len(rows[0]))
-            
-            # Add all rows
-            for row_idx, row_data in enumerate(rows):
-                cells = table.rows[row_idx].cells
-                for col_idx, cell_value in enumerate(row_data):
-                    cells[col_idx].text = str(cell_value)
+            table_rows = [[str(cell_value) for cell_value in row_data] for row_data in rows]
+        else:
+            plan["message"] = "Invalid table data format"
+            return plan
     elif artifact.file_path:
         # Load data from CSV file
         try:
-            df = pd.read_csv(artifact.file_path)
-            headers = df.columns.tolist()
-            
-            table = doc.add_table(rows=len(df) + 1, cols=len(headers))
-            
-            # Add headers
-            header_cells = table.rows[0].cells
-            for i, header in enumerate(headers):
-                header_cells[i].text = str(header)
-            
-            # Add data rows
-            for row_idx, row_data in df.iterrows():
-                cells = table.rows[row_idx + 1].cells
-                for col_idx, header in enumerate(headers):
-                    cells[col_idx].text = str(row_data[header])
+            # Parse off the event loop
+            table_rows = await asyncio.to_thread(load_csv_rows, artifact.file_path)
         except Exception as e:
-            doc.add_paragraph(f"Error loading table data: {str(e)}")
-            return
+            plan["message"] = f"Error loading table data: {str(e)}"
+            return plan
     else:
-        doc.add_paragraph("No table data available")
+        plan["message"] = "No table data available"
+        return plan
+    
+    plan["rows"] = table_rows
+    return plan
+
+def load_csv_rows(file_path: str) -> List[List[str]]:
+    """
+    Load a CSV file as stringified table rows, header row first
+    
+    Results are cached per file path and modification time, so unchanged
+    files are parsed once. The returned rows are shared; do not mutate them.
+    """
+    return _load_csv_rows(file_path, os.path.getmtime(file_path))
+
+@lru_cache(maxsize=128)
+def _load_csv_rows(file_path: str, mtime: float) -> List[List[str]]:
+    # Reading as str keeps the CSV's own formatting; blank cells stay ''
+    # rather than becoming NaN, which astype(str) would not convert
+    df = pd.read_csv(file_path, engine='c', dtype=str, keep_default_na=False)
+    # Stringify column-wise once instead of boxing each row into a Series
+    rows = [[str(header) for header in df.columns]]
+    rows.extend(df.astype(str).to_numpy().tolist())
+    return rows
+
+def render_table_section(doc: Document, plan: Dict[str, Any]) -> None:
+    """Add a table section to the document."""
+    # Add heading for table
+    heading = doc.add_heading(plan["title"], level=2)
+    
+    if "message" in plan:
+        doc.add_paragraph(plan["message"])
         return
-        
-    # Apply table style
-    table.style = 'Table Grid'
-    table.autofit = True
+    
+    append_table(doc, plan["rows"])
     
     doc.add_paragraph()  # Add space after table
 
-async def add_image_section(doc: Document, section: Dict[str, Any], db: Session) -> None:
+def _append_run_text(r, text: str) -> None:
+    """
+    Fill a <w:r> with text the way python-docx's run.text setter does:
+    tabs become <w:tab/>, line breaks <w:br/>, everything else <w:t> runs
+    """
+    # lxml escapes text on serialization
+    if not _RUN_SPECIAL_CHARS.search(text):
+        SubElement(r, _QN_T, _XML_SPACE_PRESERVE).text = text
+        return
+    for piece in _RUN_SPECIAL_CHARS.split(text):
+        if piece == "\t":
+            SubElement(r, _QN_TAB)
+        elif piece in ("\n", "\r"):
+            SubElement(r, _QN_BR)
+        elif piece:
+            SubElement(r, _QN_T, _XML_SPACE_PRESERVE).text = piece
+
+def append_table(doc: Document, rows: List[List[str]], style_id: str = "TableGrid") -> None:
+    """
+    Append a table to the document body as raw <w:tbl> XML
+    
+    Builds the whole element tree in one pass rather than going through
+    doc.add_table and per-cell .text assignment, which re-walks the XML
+    for every cell and dominates runtime on large tables.
+    
+    Args:
+        doc: Document to append to
+        rows: Cell text, row by row; the first row sets the column count
+        style_id: Table style id (the default is the "Table Grid" style)
+    """
+    n_cols = len(rows[0])
+    col_width = Emu(doc._block_width // n_cols) if n_cols else Emu(0)
+    
+    tbl = OxmlElement('w:tbl')
+    tbl_pr = SubElement(tbl, _QN_TBLPR)
+    SubElement(tbl_pr, _QN_TBLSTYLE, {_QN_VAL: style_id})
+    SubElement(tbl_pr, _QN_TBLW, {_QN_TYPE: 'auto', _QN_W: '0'})
+    
+    tbl_grid = SubElement(tbl, _QN_TBLGRID)
+    grid_width = str(col_width.twips)
+    for _ in range(n_cols):
+        SubElement(tbl_grid, _QN_GRIDCOL, {_QN_W: grid_width})
+    
+    for row in rows:
+        tr = SubElement(tbl, _QN_TR)
+        for col_idx in range(n_cols):
+            p = SubElement(SubElement(tr, _QN_TC), _QN_P)
+            value = str(row[col_idx]) if col_idx < len(row) else ""
+            if value:
+                _append_run_text(SubElement(p, _QN_R), value)
+    
+    # Insert ahead of the trailing sectPr, as doc.add_table does
+    doc.element.body._insert_tbl(tbl)
+
+async def prepare_image_section(section: Dict[str, Any], artifact: Optional[Artifact]) -> Dict[str, Any]:
+    """Read the image bytes for an image section off the event loop."""
+    plan = {"type": "image", "title": section["title"], "image_data": None}
+    
+    if not artifact:
+        plan["message"] = "Image not found"
+        return plan
+    
+    if artifact.file_path and os.path.exists(artifact.file_path):
+        try:
+            plan["image_data"] = await asyncio.to_thread(Path(artifact.file_path).read_bytes)
+        except Exception as e:
+            plan["error"] = str(e)
+    
+    return plan
+
+def render_image_section(doc: Document, plan: Dict[str, Any]) -> None:
     """Add an image section to the document."""
     # Add heading for image
-    heading = doc.add_heading(section["title"], level=2)
+    heading = doc.add_heading(plan["title"], level=2)
     
-    # Fetch the artifact data
-    artifact = db.query(Artifact).filter(Artifact.id == section["artifactId"]).first()
-    if not artifact:
-        doc.add_paragraph("Image not found")
+    if "message" in plan:
+        doc.add_paragraph(plan["message"])
         return
     
-    if artifact.file_path and os.path.exists(artifact.file_path):
+    image_data = plan["image_data"]
+    if "error" in plan:
+        doc.add_paragraph(f"Error adding image: {plan['error']}")
+    elif image_data is not None:
         # Add image to document
         try:
-            doc.add_picture(artifact.file_path, width=Inches(6))
+            doc.add_picture(BytesIO(image_data), width=Inches(6))
             
             # Add caption
-            caption = doc.add_paragraph(f"Figure: {section['title']}")
+            caption = doc.add_paragraph(f"Figure: {plan['title']}")
             caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
         except Exception as e:
             doc.add_paragraph(f"Error adding image: {str(e)}")
@@ -213,20 +386,31 @@ async def add_image_section(doc: Document, section: Dict[str, Any], db: Session)
     
     doc.add_paragraph()  # Add space after image
 
-async def add_attachment_section(doc: Document, section: Dict[str, Any], db: Session) -> None:
+async def prepare_attachment_section(section: Dict[str, Any], artifact: Optional[Artifact]) -> Dict[str, Any]:
+    """Resolve the attachment file name for an attachment section."""
+    plan = {"type": "attachment", "title": section["title"], "file_name": None}
+    
+    if not artifact:
+        plan["message"] = "Attachment not found"
+        return plan
+    
+    if artifact.file_path and os.path.exists(artifact.file_path):
+        plan["file_name"] = os.path.basename(artifact.file_path)
+    
+    return plan
+
+def render_attachment_section(doc: Document, plan: Dict[str, Any]) -> None:
     """Add an attachment reference section to the document."""
     # Add heading for attachment
-    heading = doc.add_heading(f"Attachment: {section['title']}", level=2)
+    heading = doc.add_heading(f"Attachment: {plan['title']}", level=2)
     
-    # Fetch the artifact data
-    artifact = db.query(Artifact).filter(Artifact.id == section["artifactId"]).first()
-    if not artifact:
-        doc.add_paragraph("Attachment not found")
+    if "message" in plan:
+        doc.add_paragraph(plan["message"])
         return
     
-    if artifact.file_path and os.path.exists(artifact.file_path):
+    if plan["file_name"]:
         # Add reference to attachment
-        p = doc.add_paragraph(f"File: {os.path.basename(artifact.file_path)}")
+        p = doc.add_paragraph(f"File: {plan['file_name']}")
         
         # You could potentially add hyperlink or embed the file here
         # depending on requirements
@@ -235,10 +419,14 @@ async def add_attachment_section(doc: Document, section: Dict[str, Any], db: Ses
     
     doc.add_paragraph()  # Add space after attachment reference
 
-def add_toc(doc: Document) -> str:
+def add_toc(doc: Document, bookmark_ids: Optional[Iterator[int]] = None) -> str:
     """
     Add table of contents to document
     
+    Args:
+        doc: Document to add the TOC to
+        bookmark_ids: Source of bookmark ids for this document
+    
     Returns:
         Bookmark name for TOC
     """
@@ -246,13 +434,13 @@ def add_toc(doc: Document) -> str:
     
     # Create bookmark
     bookmark_name = "toc"
-    bookmark_start = OxmlElement('w:bookmarkStart')
-    bookmark_id = str(uuid.uuid4())[:8]
-    bookmark_start.set(qn('w:id'), bookmark_id)
-    bookmark_start.set(qn('w:name'), bookmark_name)
+    bookmark_start = OxmlElement(_BM_START)
+    bookmark_id = str(next(bookmark_ids or _bm_counter))
+    bookmark_start.set(_QN_ID, bookmark_id)
+    bookmark_start.set(_QN_NAME, bookmark_name)
     
-    bookmark_end = OxmlElement('w:bookmarkEnd')
-    bookmark_end.set(qn('w:id'), bookmark_id)
+    bookmark_end = OxmlElement(_BM_END)
+    bookmark_end.set(_QN_ID, bookmark_id)
     
     # Add placeholder paragraph for TOC
     p = doc.add_paragraph()
@@ -262,7 +450,7 @@ def add_toc(doc: Document) -> str:
     # Add TOC field
     run = p.add_run()
     fld_char = OxmlElement('w:fldChar')
-    fld_char.set(qn('w:fldCharType'), 'begin')
+    fld_char.set(_QN_FLDCHARTYPE, 'begin')
     run._element.append(fld_char)
     
     instr_text = OxmlElement('w:instrText')
@@ -270,7 +458,7 @@ def add_toc(doc: Document) -> str:
     run._element.append(instr_text)
     
     fld_char = OxmlElement('w:fldChar')
-    fld_char.set(qn('w:fldCharType'), 'end')
+    fld_char.set(_QN_FLDCHARTYPE, 'end')
     run._element.append(fld_char)
     
     return bookmark_name
@@ -1,9 +1,13 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Union
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Annotated, List, Literal, Optional, Dict, Any, Union
+from copy import deepcopy
 from datetime import datetime
 from enum import Enum
 
+from lxml import etree
+
 app = FastAPI()
 
 # Enums for consistent formatting values
@@ -60,48 +64,64 @@ class RTFElement(BaseModel):
     formatting: Optional[Dict[str, Any]] = None
 
 class TextElement(RTFElement):
-    type: ElementType = ElementType.TEXT
+    type: Literal[ElementType.TEXT] = ElementType.TEXT
     content: str
     formatting: Optional[TextFormatting] = None
 
 class ParagraphElement(RTFElement):
-    type: ElementType = ElementType.PARAGRAPH
-    content: List[RTFElement]
+    type: Literal[ElementType.PARAGRAPH] = ElementType.PARAGRAPH
+    content: List['RTFNode']
     formatting: Optional[ParagraphFormatting] = None
 
 class HeadingElement(RTFElement):
-    type: ElementType = ElementType.HEADING
+    type: Literal[ElementType.HEADING] = ElementType.HEADING
     level: int = Field(..., ge=1, le=6, description="Heading level 1-6")
-    content: List[RTFElement]
+    content: List['RTFNode']
     formatting: Optional[TextFormatting] = None
 
 class ListElement(RTFElement):
-    type: ElementType = ElementType.LIST
+    type: Literal[ElementType.LIST] = ElementType.LIST
     list_type: ListType
     content: List['ListItemElement']
     formatting: Optional[ListFormatting] = None
 
 class ListItemElement(RTFElement):
-    type: ElementType = ElementType.LIST_ITEM
-    content: List[RTFElement]
+    type: Literal[ElementType.LIST_ITEM] = ElementType.LIST_ITEM
+    content: List['RTFNode']
     formatting: Optional[ParagraphFormatting] = None
 
 class HyperlinkElement(RTFElement):
-    type: ElementType = ElementType.HYPERLINK
+    type: Literal[ElementType.HYPERLINK] = ElementType.HYPERLINK
     url: str
-    content: List[RTFElement]
+    content: List['RTFNode']
     formatting: Optional[TextFormatting] = None
 
 class LineBreakElement(RTFElement):
-    type: ElementType = ElementType.LINE_BREAK
+    type: Literal[ElementType.LINE_BREAK] = ElementType.LINE_BREAK
     content: None = None
     formatting: None = None
 
 class SpanElement(RTFElement):
-    type: ElementType = ElementType.SPAN
-    content: List[RTFElement]
+    type: Literal[ElementType.SPAN] = ElementType.SPAN
+    content: List['RTFNode']
     formatting: Optional[TextFormatting] = None
 
+# Any concrete content element; the "type" tag selects the model directly
+# instead of trying each union member in turn
+RTFNode = Annotated[
+    Union[
+        TextElement,
+        ParagraphElement,
+        HeadingElement,
+        ListElement,
+        ListItemElement,
+        HyperlinkElement,
+        LineBreakElement,
+        SpanElement,
+    ],
+    Field(discriminator="type"),
+]
+
 # Document metadata
 class DocumentMetadata(BaseModel):
     created: datetime
@@ -112,14 +132,10 @@ class DocumentMetadata(BaseModel):
 # Main document model
 class RTFDocument(BaseModel):
     type: ElementType = ElementType.DOCUMENT
-    content: List[RTFElement]
+    content: List[RTFNode]
     metadata: DocumentMetadata
 
-# API request models
-class RTFContentRequest(BaseModel):
-    rtf_data: RTFDocument
-    document_id: str
-
+# API response models
 class RTFContentResponse(BaseModel):
     success: bool
     message: str
@@ -127,165 +143,221 @@ class RTFContentResponse(BaseModel):
     word_xml_preview: Optional[str] = None
 
 # Word XML conversion utilities
+
+# Characters of Word XML returned in RTFContentResponse.word_xml_preview
+PREVIEW_LENGTH = 500
+
+# Most validation errors reported back for one request
+MAX_ERROR_DETAILS = 3
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NSMAP = {"w": W_NS, "r": R_NS}
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Clark-notation tag and attribute names, built once
+_W_DOCUMENT = f"{{{W_NS}}}document"
+_W_BODY = f"{{{W_NS}}}body"
+_W_P = f"{{{W_NS}}}p"
+_W_PPR = f"{{{W_NS}}}pPr"
+_W_JC = f"{{{W_NS}}}jc"
+_W_SPACING = f"{{{W_NS}}}spacing"
+_W_R = f"{{{W_NS}}}r"
+_W_RPR = f"{{{W_NS}}}rPr"
+_W_B = f"{{{W_NS}}}b"
+_W_I = f"{{{W_NS}}}i"
+_W_U = f"{{{W_NS}}}u"
+_W_SZ = f"{{{W_NS}}}sz"
+_W_COLOR = f"{{{W_NS}}}color"
+_W_HIGHLIGHT = f"{{{W_NS}}}highlight"
+_W_T = f"{{{W_NS}}}t"
+_W_BR = f"{{{W_NS}}}br"
+_W_HYPERLINK = f"{{{W_NS}}}hyperlink"
+_W_VAL = f"{{{W_NS}}}val"
+_W_BEFORE = f"{{{W_NS}}}before"
+_W_AFTER = f"{{{W_NS}}}after"
+_W_LINE = f"{{{W_NS}}}line"
+_W_LINE_RULE = f"{{{W_NS}}}lineRule"
+_W_HISTORY = f"{{{W_NS}}}history"
+_R_ID = f"{{{R_NS}}}id"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Fixed paragraph properties, built once and deep-copied per paragraph (a
+# single C-level copy instead of a SubElement call per node)
+_LIST_ITEM_PPR = etree.fromstring(
+    f'<w:pPr xmlns:w="{W_NS}"><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>'
+)
+# Indexed by heading level - 1
+_HEADING_PPRS = tuple(
+    etree.fromstring(f'<w:pPr xmlns:w="{W_NS}"><w:pStyle w:val="Heading{level}"/></w:pPr>')
+    for level in range(1, 7)
+)
+
 class WordXMLConverter:
     """Converts RTF data structure to Microsoft Word XML format"""
     
     @staticmethod
-    def convert_to_word_xml(rtf_doc: RTFDocument) -> str:
-        """Convert RTF document to Word XML"""
-        xml_parts = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">',
-            '<w:body>'
-        ]
+    def convert_to_word_xml(rtf_doc: RTFDocument, char_limit: Optional[int] = None) -> str:
+        """
+        Convert RTF document to Word XML
+        
+        When char_limit is given, conversion stops after the top-level
+        element that brings the output to at least that many characters, so
+        a preview never pays for the whole document.
+        """
+        # Nodes are built in C by lxml, which also handles escaping and
+        # namespace binding; the tree is serialized in a single call
+        root = etree.Element(_W_DOCUMENT, nsmap=_NSMAP)
+        body = etree.SubElement(root, _W_BODY)
         
         for element in rtf_doc.content:
-            xml_parts.append(WordXMLConverter._convert_element(element))
+            WordXMLConverter._emit(element, body)
+            if char_limit is not None:
+                # Bounded by the limit, so re-serializing here stays cheap
+                xml = _XML_DECLARATION + etree.tostring(root, encoding="unicode")
+                if len(xml) >= char_limit:
+                    return xml
         
-        xml_parts.extend(['</w:body>', '</w:document>'])
-        return '\n'.join(xml_parts)
+        return _XML_DECLARATION + etree.tostring(root, encoding="unicode")
     
     @staticmethod
-    def _convert_element(element: RTFElement) -> str:
-        """Convert individual RTF element to Word XML"""
-        if element.type == ElementType.PARAGRAPH:
-            return WordXMLConverter._convert_paragraph(element)
-        elif element.type == ElementType.HEADING:
-            return WordXMLConverter._convert_heading(element)
-        elif element.type == ElementType.LIST:
-            return WordXMLConverter._convert_list(element)
-        elif element.type == ElementType.TEXT:
-            return WordXMLConverter._convert_text(element)
-        elif element.type == ElementType.HYPERLINK:
-            return WordXMLConverter._convert_hyperlink(element)
-        elif element.type == ElementType.LINE_BREAK:
-            return '<w:br/>'
-        else:
+    def _emit(element: RTFElement, parent: etree._Element) -> None:
+        """Append Word XML for an individual RTF element to parent"""
+        convert = _DISPATCH.get(element.type)
+        if convert is not None:
+            convert(element, parent)
+        elif hasattr(element, 'content') and isinstance(element.content, list):
             # Handle other elements recursively
-            if hasattr(element, 'content') and isinstance(element.content, list):
-                return ''.join(WordXMLConverter._convert_element(child) for child in element.content)
-            return ''
+            for child in element.content:
+                WordXMLConverter._emit(child, parent)
     
     @staticmethod
-    def _convert_paragraph(element: ParagraphElement) -> str:
+    def _convert_paragraph(element: ParagraphElement, parent: etree._Element) -> None:
         """Convert paragraph to Word XML"""
-        xml = ['<w:p>']
+        p = etree.SubElement(parent, _W_P)
         
         # Add paragraph properties if present
         if element.formatting:
-            xml.append('<w:pPr>')
+            ppr = etree.SubElement(p, _W_PPR)
             if element.formatting.alignment:
-                xml.append(f'<w:jc w:val="{element.formatting.alignment.value}"/>')
+                etree.SubElement(ppr, _W_JC, {_W_VAL: element.formatting.alignment.value})
             if element.formatting.spacing:
                 spacing = element.formatting.spacing
-                xml.append(f'<w:spacing w:before="{spacing.before * 20}" w:after="{spacing.after * 20}" w:line="{int(spacing.line_spacing * 240)}" w:lineRule="auto"/>')
-            xml.append('</w:pPr>')
+                etree.SubElement(ppr, _W_SPACING, {
+                    _W_BEFORE: str(spacing.before * 20),
+                    _W_AFTER: str(spacing.after * 20),
+                    _W_LINE: str(int(spacing.line_spacing * 240)),
+                    _W_LINE_RULE: "auto",
+                })
         
         # Add paragraph content
         for child in element.content:
-            xml.append(WordXMLConverter._convert_element(child))
-        
-        xml.append('</w:p>')
-        return ''.join(xml)
+            WordXMLConverter._emit(child, p)
     
     @staticmethod
-    def _convert_heading(element: HeadingElement) -> str:
+    def _convert_heading(element: HeadingElement, parent: etree._Element) -> None:
         """Convert heading to Word XML"""
-        xml = ['<w:p>']
-        xml.append('<w:pPr>')
-        xml.append(f'<w:pStyle w:val="Heading{element.level}"/>')
-        xml.append('</w:pPr>')
+        p = etree.SubElement(parent, _W_P)
+        p.append(deepcopy(_HEADING_PPRS[element.level - 1]))
         
         for child in element.content:
-            xml.append(WordXMLConverter._convert_element(child))
-        
-        xml.append('</w:p>')
-        return ''.join(xml)
+            WordXMLConverter._emit(child, p)
     
     @staticmethod
-    def _convert_text(element: TextElement) -> str:
+    def _convert_text(element: TextElement, parent: etree._Element) -> None:
         """Convert text to Word XML with formatting"""
-        xml = ['<w:r>']
+        r = etree.SubElement(parent, _W_R)
         
         # Add run properties if formatting is present
         if element.formatting:
-            xml.append('<w:rPr>')
+            rpr = etree.SubElement(r, _W_RPR)
             fmt = element.formatting
             if fmt.bold:
-                xml.append('<w:b/>')
+                etree.SubElement(rpr, _W_B)
             if fmt.italic:
-                xml.append('<w:i/>')
+                etree.SubElement(rpr, _W_I)
             if fmt.underline:
-                xml.append('<w:u w:val="single"/>')
+                etree.SubElement(rpr, _W_U, {_W_VAL: "single"})
             if fmt.font_size:
-                xml.append(f'<w:sz w:val="{int(fmt.font_size * 2)}"/>')
+                etree.SubElement(rpr, _W_SZ, {_W_VAL: str(int(fmt.font_size * 2))})
             if fmt.color:
-                xml.append(f'<w:color w:val="{fmt.color.lstrip("#")}"/>')
+                etree.SubElement(rpr, _W_COLOR, {_W_VAL: fmt.color.lstrip("#")})
             if fmt.background_color:
-                xml.append(f'<w:highlight w:val="{fmt.background_color.lstrip("#")}"/>')
-            xml.append('</w:rPr>')
+                etree.SubElement(rpr, _W_HIGHLIGHT, {_W_VAL: fmt.background_color.lstrip("#")})
         
-        xml.append(f'<w:t>{element.content}</w:t>')
-        xml.append('</w:r>')
-        return ''.join(xml)
+        t = etree.SubElement(r, _W_T, {_XML_SPACE: "preserve"})
+        t.text = element.content
     
     @staticmethod
-    def _convert_hyperlink(element: HyperlinkElement) -> str:
+    def _convert_hyperlink(element: HyperlinkElement, parent: etree._Element) -> None:
         """Convert hyperlink to Word XML"""
-        xml = [f'<w:hyperlink r:id="rId1" w:history="1">']
+        hyperlink = etree.SubElement(parent, _W_HYPERLINK, {_R_ID: "rId1", _W_HISTORY: "1"})
         
         for child in element.content:
-            xml.append(WordXMLConverter._convert_element(child))
-        
-        xml.append('</w:hyperlink>')
-        return ''.join(xml)
+            WordXMLConverter._emit(child, hyperlink)
     
     @staticmethod
-    def _convert_list(element: ListElement) -> str:
+    def _convert_list(element: ListElement, parent: etree._Element) -> None:
         """Convert list to Word XML"""
-        xml = []
         for item in element.content:
             if item.type == ElementType.LIST_ITEM:
-                xml.append('<w:p>')
-                xml.append('<w:pPr>')
-                xml.append('<w:numPr>')
-                xml.append('<w:ilvl w:val="0"/>')
-                xml.append('<w:numId w:val="1"/>')
-                xml.append('</w:numPr>')
-                xml.append('</w:pPr>')
+                p = etree.SubElement(parent, _W_P)
+                p.append(deepcopy(_LIST_ITEM_PPR))
                 
                 for child in item.content:
-                    xml.append(WordXMLConverter._convert_element(child))
-                
-                xml.append('</w:p>')
-        
-        return ''.join(xml)
+                    WordXMLConverter._emit(child, p)
+
+# Converter per element type, so _emit does one dict lookup per node
+_DISPATCH = {
+    ElementType.PARAGRAPH: WordXMLConverter._convert_paragraph,
+    ElementType.HEADING: WordXMLConverter._convert_heading,
+    ElementType.LIST: WordXMLConverter._convert_list,
+    ElementType.TEXT: WordXMLConverter._convert_text,
+    ElementType.HYPERLINK: WordXMLConverter._convert_hyperlink,
+    ElementType.LINE_BREAK: lambda element, parent: etree.SubElement(parent, _W_BR),
+}
 
 # API endpoints
 @app.post("/api/document/rtf-content", response_model=RTFContentResponse)
-async def save_rtf_content(request: RTFContentRequest):
+async def save_rtf_content(
+    rtf_data: Dict[str, Any] = Body(...),
+    document_id: str = Body(...)
+):
     """
     Save RTF content and convert to Word XML format
+    
+    The body carries rtf_data and document_id; rtf_data is taken raw so the
+    RTF tree is validated exactly once, straight into an RTFDocument.
     """
+    # Validate the RTF data structure ahead of conversion so bad input is
+    # reported through FastAPI's 422 handler
     try:
-        # Validate the RTF data structure
-        rtf_doc = request.rtf_data
-        
-        # Convert to Word XML
-        word_xml = WordXMLConverter.convert_to_word_xml(rtf_doc)
+        rtf_doc = _RTF_ADAPTER.validate_python(rtf_data)
+    except ValidationError as e:
+        # Cap the error list and leave out the offending input, which can be
+        # an arbitrarily large subtree
+        errors = e.errors(include_url=False, include_input=False)[:MAX_ERROR_DETAILS]
+        raise RequestValidationError(
+            [{**error, "loc": ("body", "rtf_data", *error["loc"])} for error in errors]
+        )
+    
+    try:
+        # Here you would typically save to database, with the full conversion
+        # word_xml = WordXMLConverter.convert_to_word_xml(rtf_doc)
+        # await save_document_to_db(document_id, rtf_doc, word_xml)
         
-        # Here you would typically save to database
-        # await save_document_to_db(request.document_id, rtf_doc, word_xml)
+        # Convert only as much as the preview needs; never persist this
+        preview_xml = WordXMLConverter.convert_to_word_xml(rtf_doc, char_limit=PREVIEW_LENGTH + 1)
         
         return RTFContentResponse(
             success=True,
             message="RTF content saved successfully",
-            document_id=request.document_id,
-            word_xml_preview=word_xml[:500] + "..." if len(word_xml) > 500 else word_xml
+            document_id=document_id,
+            word_xml_preview=preview_xml[:PREVIEW_LENGTH] + "..." if len(preview_xml) > PREVIEW_LENGTH else preview_xml
         )
         
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error processing RTF content: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing RTF content: {type(e).__name__}")
 
 @app.get("/api/document/{document_id}/rtf")
 async def get_rtf_content(document_id: str):
@@ -331,6 +403,9 @@ ListItemElement.model_rebuild()
 HyperlinkElement.model_rebuild()
 SpanElement.model_rebuild()
 
+# Compiled once; validates raw request data directly into an RTFDocument
+_RTF_ADAPTER = TypeAdapter(RTFDocument)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -83,12 +83,12 @@ data_transformation_tool/
 
 #### src/data_layer/entities/source_data.py
 ```python
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 import pandas as pd
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class SourceData:
     """Entity representing source data"""
     database_name: str
@@ -96,11 +96,16 @@ class SourceData:
     data: pd.DataFrame
     metadata: Dict[str, Any]
     created_at: datetime
+    # Shape captured once for to_dict; data is not mutated after load
+    _row_count: int = field(init=False, repr=False, compare=False)
+    _columns: List[str] = field(init=False, repr=False, compare=False)
     updated_at: Optional[datetime] = #### src/presentation_layer/api/routes.py
 ```python
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from typing import Dict, Any
 import threading
+import orjson
 from ...service_layer.data_loader.excel_loader import ExcelLoader
 from ...service_layer.transformation.parallel_engine import ParallelTransformationEngine, ParallelExecutionConfig
 from ...service_layer.orchestration.parallel_orchestrator import ParallelOrchestrator
@@ -108,7 +113,21 @@ from ...service_layer.transformation.functions.aggregation import AggregationTra
 from ...data_layer.database.repository import InMemoryRepository
 from ...utils.exceptions import DataLoadError, TransformationError
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider encoding with orjson, so the handlers' jsonify calls use it"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # default keeps Flask's fallbacks (dates, dataclasses, Decimal, UUID)
+        # for anything orjson doesn't encode natively
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Initialize services
 repository = InMemoryRepository()
@@ -117,7 +136,7 @@ excel_loader = ExcelLoader()
 # Parallel execution configuration
 parallel_config = ParallelExecutionConfig(
     max_workers=4,
-    execution_mode="thread",  # Can be "thread", "process", or "async"
+    execution_mode="process",  # Can be "thread", "process", or "async"; transformations are CPU-bound
     batch_size=10
 )
 
@@ -128,12 +147,16 @@ orchestrator = ParallelOrchestrator(repository, parallel_config)
 parallel_engine.register_transformation("aggregation", AggregationTransformation())
 orchestrator.
     
+    def __post_init__(self):
+        self._row_count = len(self.data)
+        self._columns = list(self.data.columns)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             'database_name': self.database_name,
             'table_name': self.table_name,
-            'row_count': len(self.data),
-            'columns': list(self.data.columns),
+            'row_count': self._row_count,
+            'columns': self._columns,
             'metadata': self.metadata,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
@@ -143,9 +166,9 @@ orchestrator.
 #### src/data_layer/entities/filter_config.py
 ```python
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class FilterConfig:
     """Entity representing filter configuration from Excel"""
     transformation_function: str
@@ -155,23 +178,46 @@ class FilterConfig:
     description: Optional[str] = None
     
     @classmethod
-    def from_excel_row(cls, row: Dict[str, Any]) -> 'FilterConfig':
-        """Create FilterConfig from Excel row"""
+    def build_column_map(cls, columns: Iterable[str]) -> Dict[str, Tuple[str, Optional[str]]]:
+        """Classify sheet columns once: col -> ('filter' | 'param', stripped name),
+        or ('skip', None) for everything else
+        """
+        column_map = {}
+        for col in columns:
+            if col.startswith('filter_col'):
+                column_map[col] = ('filter', col.replace('filter_col', '').strip('_'))
+            elif col.startswith('param_'):
+                column_map[col] = ('param', col.replace('param_', ''))
+            else:
+                column_map[col] = ('skip', None)
+        return column_map
+    
+    @classmethod
+    def from_excel_row(cls, row: Dict[str, Any],
+                       column_map: Optional[Dict[str, Tuple[str, Optional[str]]]] = None) -> 'FilterConfig':
+        """Create FilterConfig from Excel row
+        
+        Pass the sheet's build_column_map result to classify the columns once
+        for every row instead of re-parsing each key.
+        """
         transformation_function = row.get('transformation_function', '')
         
+        if column_map is None:
+            column_map = cls.build_column_map(row)
+        
         # Extract filter columns (columns starting with 'filter_')
         filter_columns = {}
         parameters = {}
+        buckets = {'filter': filter_columns, 'param': parameters}
         
-        for key, value in row.items():
-            if key.startswith('filter_col'):
-                col_name = key.replace('filter_col', '').strip('_')
-                if pd.notna(value):
-                    filter_columns[col_name] = value
-            elif key.startswith('param_'):
-                param_name = key.replace('param_', '')
-                if pd.notna(value):
-                    parameters[param_name] = value
+        # NaN is the only value not equal to itself, so this skips empty
+        # cells without a pandas call per cell
+        for key, (bucket, name) in column_map.items():
+            if bucket == 'skip':
+                continue
+            value = row[key]
+            if value is not None and value == value:
+                buckets[bucket][name] = value
         
         return cls(
             transformation_function=transformation_function,
@@ -184,12 +230,13 @@ class FilterConfig:
 
 #### src/data_layer/entities/execution_context.py
 ```python
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import threading
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Context for tracking parallel execution of transformations"""
     execution_id: str
@@ -201,6 +248,9 @@ class ExecutionContext:
     results: List[str] = None  # List of result IDs
     errors: List[str] = None
     status: str = "PENDING"  # PENDING, RUNNING, COMPLETED, FAILED
+    # Completions arrive from executor threads; _remaining reaches zero exactly once
+    _lock: threading.Lock = field(init=False, repr=False, compare=False)
+    _remaining: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.started_at is None:
@@ -211,22 +261,27 @@ class ExecutionContext:
             self.errors = []
         if self.execution_id is None:
             self.execution_id = str(uuid.uuid4())
+        self._lock = threading.Lock()
+        self._remaining = self.total_tasks - self.completed_tasks - self.failed_tasks
     
     def mark_task_completed(self, result_id: str):
         """Mark a task as completed"""
-        self.completed_tasks += 1
-        self.results.append(result_id)
-        self._update_status()
+        with self._lock:
+            self.completed_tasks += 1
+            self.results.append(result_id)
+            self._update_status()
     
     def mark_task_failed(self, error: str):
         """Mark a task as failed"""
-        self.failed_tasks += 1
-        self.errors.append(error)
-        self._update_status()
+        with self._lock:
+            self.failed_tasks += 1
+            self.errors.append(error)
+            self._update_status()
     
     def _update_status(self):
-        """Update execution status based on task completion"""
-        if self.completed_tasks + self.failed_tasks == self.total_tasks:
+        """Count one finished task and update the status; caller holds _lock"""
+        self._remaining -= 1
+        if self._remaining == 0:
             self.completed_at = datetime.now()
             if self.failed_tasks == 0:
                 self.status = "COMPLETED"
@@ -234,7 +289,7 @@ class ExecutionContext:
                 self.status = "FAILED"
             else:
                 self.status = "PARTIALLY_COMPLETED"
-        else:
+        elif self._remaining > 0:
             self.status = "RUNNING"
     
     def to_dict(self) -> Dict[str, Any]:
@@ -254,15 +309,28 @@ class ExecutionContext:
 
 #### src/data_layer/entities/transformation_result.py
 ```python
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
+import itertools
+import os
+import uuid
 import pandas as pd
 from datetime import datetime
 
-@dataclass
+# Result ids only have to be unique, not unguessable: host node, pid and a
+# per-process sequence are, without uuid4's urandom call per result. The pid
+# is read per id so forked workers don't reuse their parent's prefix.
+_NODE_ID = f"{uuid.getnode():x}"
+_result_counter = itertools.count(1)
+
+def next_result_id() -> str:
+    return f"{_NODE_ID}-{os.getpid()}-{next(_result_counter)}"
+
+@dataclass(slots=True)
 class TransformationResult:
     """Entity representing transformation result"""
-    result_id: str
+    # Keyword-only so it can default while the required fields stay positional
+    result_id: str = field(default_factory=next_result_id, kw_only=True)
     source_table: str
     transformation_function: str
     result_data: pd.DataFrame
@@ -272,19 +340,23 @@ class TransformationResult:
     execution_id: Optional[str] = None
     worker_id: Optional[str] = None
     errors: Optional[List[str]] = None
+    # Shape captured once for to_dict; result_data is not mutated after creation
+    _result_rows: int = field(init=False, repr=False, compare=False)
+    _result_columns: List[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.result_id is None:
-            import uuid
-            self.result_id = str(uuid.uuid4())
+            self.result_id = next_result_id()
+        self._result_rows = len(self.result_data)
+        self._result_columns = list(self.result_data.columns)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             'result_id': self.result_id,
             'source_table': self.source_table,
             'transformation_function': self.transformation_function,
-            'result_rows': len(self.result_data),
-            'result_columns': list(self.result_data.columns),
+            'result_rows': self._result_rows,
+            'result_columns': self._result_columns,
             'filter_applied': self.filter_applied,
             'execution_time': self.execution_time,
             'created_at': self.created_at.isoformat(),
@@ -298,7 +370,9 @@ class TransformationResult:
 ```python
 from typing import List, Optional, Dict, Any
 import pandas as pd
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from ..entities.source_data import SourceData
 from ..entities.transformation_result import TransformationResult
 
@@ -326,7 +400,9 @@ class InMemoryRepository(DataRepository):
     
     def __init__(self):
         self._source_data: Dict[str, SourceData] = {}
-        self._transformation_results: List[TransformationResult] = []
+        # Results are indexed by source table; saves arrive from executor threads
+        self._transformation_results: Dict[str, List[TransformationResult]] = defaultdict(list)
+        self._results_lock = threading.Lock()
     
     def save_source_data(self, source_data: SourceData) -> bool:
         key = f"{source_data.database_name}.{source_data.table_name}"
@@ -338,40 +414,97 @@ class InMemoryRepository(DataRepository):
         return self._source_data.get(key)
     
     def save_transformation_result(self, result: TransformationResult) -> bool:
-        self._transformation_results.append(result)
+        with self._results_lock:
+            self._transformation_results[result.source_table].append(result)
         return True
     
     def get_transformation_results(self, source_table: str) -> List[TransformationResult]:
-        return [r for r in self._transformation_results if r.source_table == source_table]
+        with self._results_lock:
+            return list(self._transformation_results.get(source_table, ()))
 ```
 
 ### 2. Service Layer
 
 #### src/service_layer/data_loader/excel_loader.py
 ```python
+import os
+import threading
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from ...data_layer.entities.source_data import SourceData
 from ...data_layer.entities.filter_config import FilterConfig
 from ...utils.exceptions import DataLoadError
 from datetime import datetime
 
+# calamine parses workbooks in native code; openpyxl is the pure-Python fallback
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+
+# Guards parsing through a shared ExcelFile, whose reader is not thread-safe
+_workbook_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _open_workbook(file_path: str, mtime: float) -> pd.ExcelFile:
+    """Open a workbook once so every sheet read reuses its unzipped container"""
+    return pd.ExcelFile(file_path, engine=EXCEL_ENGINE)
+
+
+@lru_cache(maxsize=32)
+def _read_excel_cached(file_path: str, mtime: float, sheet_name: str = None) -> pd.DataFrame:
+    """Parse one sheet; mtime is part of the key so an edited workbook is reread"""
+    with _workbook_lock:
+        return _open_workbook(file_path, mtime).parse(sheet_name or 0)
+
+
+def _read_excel(file_path: str, sheet_name: str = None, mtime: float = None) -> pd.DataFrame:
+    """Read one sheet (the first when sheet_name is None) with EXCEL_ENGINE
+    
+    Config and source sheets of the same workbook are parsed once per process;
+    callers get a shallow copy so adding or dropping columns leaves the
+    cached frame intact. Pass mtime when the file has already been stat'ed.
+    """
+    if mtime is None:
+        mtime = os.path.getmtime(file_path)
+    df = _read_excel_cached(file_path, mtime, sheet_name)
+    return df.copy(deep=False)
+
+
 class ExcelLoader:
     """Service for loading data from Excel files"""
     
+    def __init__(self, layout: Optional[str] = 'F'):
+        """layout is the memory order forced on homogeneous numeric source data:
+        'F' (column-major) suits the column-wise aggregations, 'C' row-wise
+        work, and None keeps whatever the reader produced.
+        """
+        if layout not in ('C', 'F', None):
+            raise ValueError(f"Unknown layout: {layout}")
+        self.layout = layout
+    
     def load_source_data(self, file_path: str, database_name: str, 
                         sheet_name: str = None) -> SourceData:
         """Load source data from Excel file"""
         try:
-            if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            else:
-                df = pd.read_excel(file_path)
+            # One stat serves the cache key and the size/mtime metadata
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                stat = None
+            
+            df = self._apply_layout(_read_excel(file_path, sheet_name, stat.st_mtime if stat else None))
             
             metadata = {
                 'file_path': file_path,
                 'sheet_name': sheet_name,
-                'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                'file_size': stat.st_size if stat else 0,
+                'file_mtime': stat.st_mtime if stat else None
             }
             
             return SourceData(
@@ -387,31 +520,75 @@ class ExcelLoader:
     def load_filter_config(self, file_path: str, sheet_name: str = None) -> List[FilterConfig]:
         """Load filter configuration from Excel file"""
         try:
-            if sheet_name:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            else:
-                df = pd.read_excel(file_path)
-            
-            filters = []
-            for _, row in df.iterrows():
-                filter_config = FilterConfig.from_excel_row(row.to_dict())
-                filters.append(filter_config)
+            df = _read_excel(file_path, sheet_name)
             
-            return filters
+            # Partition the columns once and slice each group as a sub-frame,
+            # so the filter/param split is column work rather than per cell
+            column_map = FilterConfig.build_column_map(df.columns)
+            filter_cols = {col: name for col, (bucket, name) in column_map.items() if bucket == 'filter'}
+            param_cols = {col: name for col, (bucket, name) in column_map.items() if bucket == 'param'}
+
+            filter_dicts = self._non_null_records(df[list(filter_cols)].rename(columns=filter_cols))
+            param_dicts = self._non_null_records(df[list(param_cols)].rename(columns=param_cols))
+
+            def column(name: str, default: Any) -> List[Any]:
+                return df[name].tolist() if name in df.columns else [default] * len(df)
+
+            return [
+                FilterConfig(
+                    transformation_function=function,
+                    filter_columns=filter_columns,
+                    parameters=parameters,
+                    priority=priority,
+                    description=description
+                )
+                for function, filter_columns, parameters, priority, description in zip(
+                    column('transformation_function', ''), filter_dicts, param_dicts,
+                    column('priority', 0), column('description', None)
+                )
+            ]
         except Exception as e:
             raise DataLoadError(f"Failed to load filter config from {file_path}: {str(e)}")
+
+    def _apply_layout(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rebuild df on a single array in self.layout order
+        
+        Only a frame of one numeric dtype sits in a single 2-D block whose
+        order matters; mixed frames already keep one block per dtype and are
+        returned as is.
+        """
+        if self.layout is None or df.empty or df.dtypes.nunique() != 1:
+            return df
+        if not pd.api.types.is_numeric_dtype(df.dtypes.iloc[0]):
+            return df
+        
+        values = df.to_numpy()
+        values = np.asfortranarray(values) if self.layout == 'F' else np.ascontiguousarray(values)
+        return pd.DataFrame(values, index=df.index, columns=df.columns, copy=False)
+
+    @staticmethod
+    def _non_null_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Row dicts of df keeping only the non-null cells"""
+        present = df.notna().to_numpy()
+        return [
+            {key: value for (key, value), keep in zip(record.items(), mask) if keep}
+            for record, mask in zip(df.to_dict(orient='records'), present)
+        ]
 ```
 
 #### src/service_layer/transformation/parallel_engine.py
 ```python
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, FrozenSet, Set
 import pandas as pd
 from datetime import datetime
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from itertools import repeat
 import multiprocessing
+import threading
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
 from ...data_layer.entities.source_data import SourceData
 from ...data_layer.entities.filter_config import FilterConfig
@@ -422,11 +599,77 @@ from ...utils.exceptions import TransformationError
 from ...utils.logger import setup_logger
 from .transformation_engine import TransformationEngine
 
+logger = setup_logger(__name__)
+
+# Source data installed once per worker process by _init_worker, so process
+# tasks carry a (database_name, table_name) key instead of a pickled DataFrame
+_worker_source_data: Dict[Tuple[str, str], SourceData] = {}
+
+def _source_key(source_data: SourceData) -> Tuple[str, str]:
+    return (source_data.database_name, source_data.table_name)
+
+class _SourceIndex:
+    """Sources indexed by column name, so matching a filter config is a set
+    intersection instead of a scan over every source's columns
+    """
+    
+    def __init__(self, source_data_list: List[SourceData]):
+        self._sources = list(source_data_list)
+        self._by_column: Dict[Any, Set[int]] = defaultdict(set)
+        for position, source_data in enumerate(self._sources):
+            for column in source_data.data.columns:
+                self._by_column[column].add(position)
+        # Configs repeat the same filter columns, so matches are memoised
+        self._matches: Dict[FrozenSet[Any], Optional[SourceData]] = {}
+    
+    def first_with_columns(self, columns: FrozenSet[Any]) -> Optional[SourceData]:
+        """First source, in list order, holding every one of columns"""
+        if columns not in self._matches:
+            positions = set(range(len(self._sources)))
+            for column in columns:
+                positions &= self._by_column.get(column, set())
+                if not positions:
+                    break
+            self._matches[columns] = self._sources[min(positions)] if positions else None
+        return self._matches[columns]
+
+def _init_worker(source_data_list: List[SourceData]):
+    """ProcessPoolExecutor initializer keeping the task sources resident"""
+    _worker_source_data.clear()
+    _worker_source_data.update((_source_key(source_data), source_data) for source_data in source_data_list)
+
+def _execute_shared_transformation_worker(source_key: Tuple[str, str],
+                                          filter_config: FilterConfig,
+                                          execution_id: str) -> TransformationResult:
+    """Process entry point resolving its source data from the worker cache
+    
+    Failures come back as a result carrying errors rather than an exception,
+    so one bad task cannot end an executor.map over the rest.
+    """
+    try:
+        return _execute_transformation_worker(_worker_source_data[source_key], filter_config, execution_id)
+    except Exception as e:
+        return TransformationResult(
+            source_table=source_key[1],
+            transformation_function=filter_config.transformation_function,
+            result_data=pd.DataFrame(),
+            filter_applied=filter_config.filter_columns,
+            execution_time=0.0,
+            created_at=datetime.now(),
+            execution_id=execution_id,
+            worker_id=multiprocessing.current_process().name,
+            errors=[str(e)]
+        )
+
 @dataclass
 class ParallelExecutionConfig:
-    """Configuration for parallel execution"""
+    """Configuration for parallel execution
+    
+    Transformations are pandas work that holds the GIL, so "process" is the
+    default; "thread" only pays off when they mostly wait on I/O.
+    """
     max_workers: Optional[int] = None
-    execution_mode: str = "thread"  # "thread", "process", "async"
+    execution_mode: str = "process"  # "thread", "process", "async"
     batch_size: int = 10
     timeout: Optional[int] = None
     memory_limit_mb: Optional[int] = None
@@ -434,6 +677,9 @@ class ParallelExecutionConfig:
     def __post_init__(self):
         if self.max_workers is None:
             self.max_workers = min(multiprocessing.cpu_count(), 8)
+        if self.execution_mode == "thread":
+            logger.warning("Thread execution mode is only appropriate for I/O-bound transformations; "
+                           "CPU-bound ones are serialized by the GIL")
 
 class ParallelTransformationEngine:
     """Engine for parallel execution of transformations"""
@@ -462,17 +708,34 @@ class ParallelTransformationEngine:
         
         self.logger.info(f"Starting parallel execution {execution_context.execution_id} with {len(filter_configs)} tasks")
         
+        # Index the sources by column once instead of rescanning them per config
+        source_lookup = _SourceIndex(source_data_list)
+        
+        # With at most one task there is nothing to overlap, and a pool costs
+        # more to start than the task itself
+        if len(filter_configs) <= 1:
+            return self._execute_inline(source_lookup, filter_configs, execution_context, progress_callback)
+        
         # Choose execution mode
         if self.config.execution_mode == "thread":
-            return self._execute_with_threads(source_data_list, filter_configs, execution_context, progress_callback)
+            return self._execute_with_threads(source_lookup, filter_configs, execution_context, progress_callback)
         elif self.config.execution_mode == "process":
-            return self._execute_with_processes(source_data_list, filter_configs, execution_context, progress_callback)
+            return self._execute_with_processes(source_lookup, filter_configs, execution_context, progress_callback)
         elif self.config.execution_mode == "async":
-            return asyncio.run(self._execute_with_async(source_data_list, filter_configs, execution_context, progress_callback))
+            return asyncio.run(self._execute_with_async(source_lookup, filter_configs, execution_context, progress_callback))
         else:
             raise ValueError(f"Unknown execution mode: {self.config.execution_mode}")
     
-    def _execute_with_threads(self, source_data_list: List[SourceData], 
+    def _find_matching_source_data(self, source_lookup: _SourceIndex,
+                                   filter_config: FilterConfig) -> Optional[SourceData]:
+        """First source whose columns include all of the config's filter columns"""
+        return source_lookup.first_with_columns(frozenset(filter_config.filter_columns))
+    
+    def _pool_size(self, task_count: int) -> int:
+        """Workers to start for task_count tasks; never more than there is work for"""
+        return max(1, min(self.config.max_workers, task_count))
+    
+    def _execute_with_threads(self, source_lookup: _SourceIndex, 
                             filter_configs: List[FilterConfig],
                             execution_context: ExecutionContext,
                             progress_callback: Optional[Callable] = None) -> ExecutionContext:
@@ -480,50 +743,113 @@ class ParallelTransformationEngine:
         
         execution_context.status = "RUNNING"
         
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # Submit all tasks
+        workers = self._pool_size(len(filter_configs))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="xform") as executor:
+            # Keep at most two tasks per worker in flight and top the window up
+            # as tasks finish, instead of queueing every config upfront
+            window = 2 * workers
             future_to_config = {}
+            pending_configs = iter(filter_configs)
             
-            for filter_config in filter_configs:
-                # Find matching source data
-                source_data = self._find_matching_source_data(source_data_list, filter_config)
-                if source_data:
-                    future = executor.submit(
-                        self._execute_single_transformation,
-                        source_data,
-                        filter_config,
-                        execution_context.execution_id,
-                        f"thread-{threading.current_thread().ident}"
-                    )
-                    future_to_config[future] = filter_config
-                else:
+            def submit_next() -> bool:
+                for filter_config in pending_configs:
+                    # Find matching source data
+                    source_data = self._find_matching_source_data(source_lookup, filter_config)
+                    if source_data:
+                        future = executor.submit(
+                            self._execute_on_worker_thread,
+                            source_data,
+                            filter_config,
+                            execution_context.execution_id
+                        )
+                        future_to_config[future] = filter_config
+                        return True
                     execution_context.mark_task_failed(f"No source data found for filter: {filter_config.transformation_function}")
+                return False
+            
+            while len(future_to_config) < window and submit_next():
+                pass
+            
+            # The timeout bounds the whole run, not each wait for the next task
+            deadline = None if self.config.timeout is None else time.monotonic() + self.config.timeout
             
             # Process completed tasks
-            for future in as_completed(future_to_config, timeout=self.config.timeout):
-                filter_config = future_to_config[future]
+            while future_to_config:
+                remaining = None if deadline is None else max(0, deadline - time.monotonic())
+                done, _ = wait(future_to_config, timeout=remaining, return_when=FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError(f"{len(future_to_config)} transformations did not finish within {self.config.timeout}s")
                 
-                try:
-                    result = future.result()
-                    if result.errors:
-                        execution_context.mark_task_failed(f"Task failed: {result.errors}")
-                    else:
-                        self.repository.save_transformation_result(result)
-                        execution_context.mark_task_completed(result.result_id)
+                for future in done:
+                    filter_config = future_to_config.pop(future)
                     
-                    if progress_callback:
-                        progress_callback(execution_context)
+                    try:
+                        result = future.result()
+                        if result.errors:
+                            execution_context.mark_task_failed(f"Task failed: {result.errors}")
+                        else:
+                            self.repository.save_transformation_result(result)
+                            execution_context.mark_task_completed(result.result_id)
                         
-                except Exception as e:
-                    self.logger.error(f"Task {filter_config.transformation_function} failed: {str(e)}")
-                    execution_context.mark_task_failed(str(e))
+                        if progress_callback:
+                            progress_callback(execution_context)
+                            
+                    except Exception as e:
+                        self.logger.error(f"Task {filter_config.transformation_function} failed: {str(e)}")
+                        execution_context.mark_task_failed(str(e))
+                        
+                        if progress_callback:
+                            progress_callback(execution_context)
                     
-                    if progress_callback:
-                        progress_callback(execution_context)
+                    submit_next()
         
         return execution_context
     
-    def _execute_with_processes(self, source_data_list: List[SourceData], 
+    def _execute_on_worker_thread(self, source_data: SourceData,
+                                  filter_config: FilterConfig,
+                                  execution_id: str) -> TransformationResult:
+        """Run one transformation tagged with the pool thread executing it"""
+        # Read here rather than at submit time, where it named the submitting thread
+        worker_id = threading.current_thread().name
+        return self._execute_single_transformation(source_data, filter_config, execution_id, worker_id)
+    
+    def _execute_inline(self, source_lookup: _SourceIndex,
+                        filter_configs: List[FilterConfig],
+                        execution_context: ExecutionContext,
+                        progress_callback: Optional[Callable] = None) -> ExecutionContext:
+        """Execute transformations one after another in the calling thread"""
+        
+        execution_context.status = "RUNNING"
+        
+        for filter_config in filter_configs:
+            source_data = self._find_matching_source_data(source_lookup, filter_config)
+            if not source_data:
+                execution_context.mark_task_failed(f"No source data found for filter: {filter_config.transformation_function}")
+                continue
+            
+            try:
+                result = self._execute_single_transformation(
+                    source_data,
+                    filter_config,
+                    execution_context.execution_id,
+                    "inline"
+                )
+                if result.errors:
+                    execution_context.mark_task_failed(f"Task failed: {result.errors}")
+                else:
+                    self.repository.save_transformation_result(result)
+                    execution_context.mark_task_completed(result.result_id)
+            except Exception as e:
+                self.logger.error(f"Task {filter_config.transformation_function} failed: {str(e)}")
+                execution_context.mark_task_failed(str(e))
+            
+            if progress_callback:
+                progress_callback(execution_context)
+        
+        return execution_context
+    
+    def _execute_with_processes(self, source_lookup: _SourceIndex, 
                               filter_configs: List[FilterConfig],
                               execution_context: ExecutionContext,
                               progress_callback: Optional[Callable] = None) -> ExecutionContext:
@@ -531,15 +857,63 @@ class ParallelTransformationEngine:
         
         execution_context.status = "RUNNING"
         
-        with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
+        # Pair every config with its source data before dispatching
+        tasks = []
+        for filter_config in filter_configs:
+            source_data = self._find_matching_source_data(source_lookup, filter_config)
+            if source_data:
+                tasks.append((source_data, filter_config))
+            else:
+                execution_context.mark_task_failed(f"No source data found for filter: {filter_config.transformation_function}")
+        
+        # Each worker receives every distinct source once at startup rather
+        # than once per task
+        sources = {_source_key(source_data): source_data for source_data, _ in tasks}
+        
+        with ProcessPoolExecutor(max_workers=self._pool_size(len(tasks)),
+                                 initializer=_init_worker,
+                                 initargs=(list(sources.values()),)) as executor:
+            if progress_callback is None:
+                # Without progress reporting results can come back in order,
+                # so map ships tasks in batch_size chunks: one pickle round
+                # trip per chunk instead of one per task
+                results = executor.map(
+                    _execute_shared_transformation_worker,
+                    [_source_key(source_data) for source_data, _ in tasks],
+                    [filter_config for _, filter_config in tasks],
+                    repeat(execution_context.execution_id),
+                    timeout=self.config.timeout,
+                    chunksize=self.config.batch_size
+                )
+                
+                processed = 0
+                try:
+                    for result in results:
+                        try:
+                            if result.errors:
+                                execution_context.mark_task_failed(f"Task failed: {result.errors}")
+                            else:
+                                self.repository.save_transformation_result(result)
+                                execution_context.mark_task_completed(result.result_id)
+                        except Exception as e:
+                            self.logger.error(f"Saving result of {result.transformation_function} failed: {str(e)}")
+                            execution_context.mark_task_failed(str(e))
+                        # Counted once marked, so the tail below covers exactly the rest
+                        processed += 1
+                except Exception as e:
+                    # Workers return their errors, so only a timeout or a
+                    # broken pool ends map early; the unfinished tasks fail
+                    self.logger.error(f"Process execution failed: {str(e)}")
+                    for _ in range(len(tasks) - processed):
+                        execution_context.mark_task_failed(str(e))
+                
+                return execution_context
+            
             # Submit all tasks
             future_to_config = {}
             
-            for filter_config in filter_configs:
-                # Find matching source data
-                source_data = self._find_matching_source_data(source_data_list, filter_config)
-                if source_data:
-                    future = executor.submit(
-                        _execute_transformation_worker,
-                        source_data,
-                        filter
\ No newline at end of file
+            for source_data, filter_config in tasks:
+                future = executor.submit(
+                    _execute_shared_transformation_worker,
+                    _source_key(source_data),
+                    filter
\ No newline at end of file
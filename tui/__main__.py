@@ -4,8 +4,20 @@ import sys
 import asyncio
 
 
+def _install_uvloop():
+    """Use uvloop's libuv-backed event loop when it is available."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Main entry point."""
+    _install_uvloop()
     try:
         app = GraphTUIApp()
         app.run()
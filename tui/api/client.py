@@ -1,47 +1,372 @@
 """GraphQL API client."""
 
 import asyncio
-from typing import Any, AsyncIterator, Dict, List, Optional
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
 from contextlib import asynccontextmanager
 
+import httpx
+import orjson
 from gql import Client, gql
-from gql.transport.aiohttp import AIOHTTPTransport
+from pydantic import TypeAdapter
+from gql.transport.exceptions import TransportError, TransportQueryError
+from gql.transport.httpx import HTTPXAsyncTransport
 from gql.transport.websockets import WebsocketsTransport
+from graphql import DocumentNode, ExecutionResult, print_ast
 
 from graph_tui.config import settings
 from graph_tui.models import Graph, Node, Execution, ExecutionLog, NodeStatus, GraphStatus
 
 
+class _PersistedQuery(NamedTuple):
+    """Document with its automatic persisted query (APQ) fields precomputed."""
+    document: DocumentNode
+    text: str
+    operation_name: str
+    sha256: str
+
+
+def _persisted(document: DocumentNode) -> _PersistedQuery:
+    """Hash the printed document, which is the text sent on a cache miss."""
+    text = print_ast(document)
+    return _PersistedQuery(
+        document=document,
+        text=text,
+        operation_name=document.definitions[0].name.value,
+        sha256=hashlib.sha256(text.encode()).hexdigest(),
+    )
+
+
+def _apq_error_code(error: TransportQueryError) -> Optional[str]:
+    """Return the APQ error code carried by a query error, if any."""
+    for err in error.errors or []:
+        code = (err.get("extensions") or {}).get("code")
+        if code in ("PERSISTED_QUERY_NOT_FOUND", "PERSISTED_QUERY_NOT_SUPPORTED"):
+            return code
+        if err.get("message") == "PersistedQueryNotFound":
+            return "PERSISTED_QUERY_NOT_FOUND"
+        if err.get("message") == "PersistedQueryNotSupported":
+            return "PERSISTED_QUERY_NOT_SUPPORTED"
+    return None
+
+
+# Documents are parsed and hashed once at import rather than on every call
+
+_QUERY_LIST_GRAPHS = _persisted(gql("""
+    query ListGraphs {
+        graphs {
+            id
+            name
+            description
+            status
+            createdAt
+            updatedAt
+        }
+    }
+"""))
+
+_QUERY_LIST_GRAPHS_DETAILED = _persisted(gql("""
+    query ListGraphsDetailed {
+        graphs {
+            id
+            name
+            description
+            status
+            createdAt
+            updatedAt
+            nodes {
+                id
+                name
+                type
+                description
+                position { x, y }
+                config
+                status
+                parentIds
+                childIds
+                startedAt
+                completedAt
+                errorMessage
+                result
+            }
+            edges {
+                id
+                sourceId
+                targetId
+                label
+            }
+        }
+    }
+"""))
+
+_QUERY_GET_GRAPH = _persisted(gql("""
+    query GetGraph($id: ID!) {
+        graph(id: $id) {
+            id
+            name
+            description
+            status
+            createdAt
+            updatedAt
+            nodes {
+                id
+                name
+                type
+                description
+                position { x, y }
+                config
+                status
+                parentIds
+                childIds
+                startedAt
+                completedAt
+                errorMessage
+                result
+            }
+            edges {
+                id
+                sourceId
+                targetId
+                label
+            }
+        }
+    }
+"""))
+
+_QUERY_GET_EXECUTION = _persisted(gql("""
+    query GetExecution($graphId: ID!) {
+        execution(graphId: $graphId) {
+            id
+            graphId
+            status
+            startedAt
+            completedAt
+            progress
+            logs {
+                timestamp
+                nodeId
+                level
+                message
+            }
+        }
+    }
+"""))
+
+_MUTATION_CREATE_GRAPH = _persisted(gql("""
+    mutation CreateGraph($input: CreateGraphInput!) {
+        createGraph(input: $input) {
+            id
+            name
+            description
+            status
+        }
+    }
+"""))
+
+_MUTATION_CREATE_NODE = _persisted(gql("""
+    mutation CreateNode($input: CreateNodeInput!) {
+        createNode(input: $input) {
+            id
+            name
+            type
+            position { x, y }
+            config
+            status
+        }
+    }
+"""))
+
+_MUTATION_UPDATE_NODE = _persisted(gql("""
+    mutation UpdateNode($id: ID!, $input: UpdateNodeInput!) {
+        updateNode(id: $id, input: $input) {
+            id
+            name
+            type
+            position { x, y }
+            config
+        }
+    }
+"""))
+
+_MUTATION_DELETE_NODE = _persisted(gql("""
+    mutation DeleteNode($id: ID!) {
+        deleteNode(id: $id)
+    }
+"""))
+
+_MUTATION_CONNECT_NODES = _persisted(gql("""
+    mutation ConnectNodes($input: ConnectNodesInput!) {
+        connectNodes(input: $input) {
+            id
+        }
+    }
+"""))
+
+_MUTATION_EXECUTE_GRAPH = _persisted(gql("""
+    mutation ExecuteGraph($graphId: ID!) {
+        executeGraph(graphId: $graphId) {
+            id
+        }
+    }
+"""))
+
+_SUB_EXECUTION_UPDATES_TEMPLATE = """
+    subscription ExecutionUpdates($graphId: ID!) {
+        executionUpdates(graphId: $graphId) {
+            id
+            graphId
+            status
+            startedAt
+            completedAt
+            progress
+            logs {
+                timestamp
+                nodeId
+                level
+                message
+            }%s
+        }
+    }
+"""
+
+_SUB_EXECUTION_UPDATES = gql(_SUB_EXECUTION_UPDATES_TEMPLATE % "")
+
+# Variant for servers whose Execution type reports per-node statuses
+_SUB_EXECUTION_UPDATES_WITH_NODE_STATUSES = gql(_SUB_EXECUTION_UPDATES_TEMPLATE % """
+            nodeStatuses {
+                nodeId
+                status
+            }""")
+
+
+def _orjson_dumps(obj: Any) -> str:
+    """orjson encoder returning str, as gql expects from json_serialize."""
+    return orjson.dumps(obj).decode()
+
+
+class _OrjsonHTTPXAsyncTransport(HTTPXAsyncTransport):
+    """HTTPX transport that encodes requests and decodes responses with orjson.
+    
+    gql hands the payload to httpx as json= and parses with response.json(),
+    both stdlib json; these hooks swap in orjson on the raw bytes.
+    """
+    
+    def _prepare_request(self, *args, **kwargs) -> Dict[str, Any]:
+        post_args = super()._prepare_request(*args, **kwargs)
+        if "json" in post_args:
+            post_args["content"] = orjson.dumps(post_args.pop("json"))
+            post_args["headers"] = {
+                **post_args.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+        return post_args
+    
+    def _prepare_result(self, response: httpx.Response) -> ExecutionResult:
+        self.response_headers = response.headers
+        
+        try:
+            result: Dict[str, Any] = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            self._raise_response_error(response, "Not a JSON answer")
+        
+        if not isinstance(result, dict) or ("errors" not in result and "data" not in result):
+            self._raise_response_error(response, 'No "data" or "errors" keys in answer')
+        
+        return ExecutionResult(
+            errors=result.get("errors"),
+            data=result.get("data"),
+            extensions=result.get("extensions"),
+        )
+
+
+# Validators are compiled once and reused for every response
+_GRAPH_ADAPTER = TypeAdapter(Graph)
+_NODE_ADAPTER = TypeAdapter(Node)
+_EXECUTION_ADAPTER = TypeAdapter(Execution)
+
+_CAMEL_WORD_RE = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_TAIL_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+
+@lru_cache(maxsize=512)
+def _to_snake(name: str) -> str:
+    """Convert camelCase to snake_case.
+    
+    The response field vocabulary is small and fixed, so nearly every call
+    after the first few responses is a cache hit.
+    """
+    return _CAMEL_TAIL_RE.sub(r'\1_\2', _CAMEL_WORD_RE.sub(r'\1_\2', name)).lower()
+
+
+# get_graph() results are reused for this long (seconds), well under
+# settings.refresh_rate, so back-to-back reloads share one query
+_GRAPH_CACHE_TTL = 1.5
+_GRAPH_CACHE_SIZE = 16
+
+
 class GraphQLClient:
     """GraphQL client wrapper."""
     
     def __init__(self):
         """Initialize client."""
         self._http_client: Optional[Client] = None
+        self._http_session = None
         self._ws_client: Optional[Client] = None
+        self._connected = False
+        self._persisted_queries = settings.persisted_queries
+        # Set once a hash-only request succeeds; until then any rejection is
+        # taken to mean the server does not speak APQ
+        self._persisted_queries_confirmed = False
+        # Whether executionUpdates exposes nodeStatuses; None until the first
+        # subscription finds out
+        self._node_statuses_supported: Optional[bool] = None
+        self._graph_cache: "OrderedDict[str, Tuple[float, Graph]]" = OrderedDict()
     
     async def connect(self):
-        """Connect to GraphQL endpoint."""
+        """Connect to GraphQL endpoint.
+        
+        Safe to call repeatedly; the first call opens one long-lived HTTP/2
+        session, so every query and mutation until disconnect() is a stream
+        multiplexed over the same connection.
+        """
+        if self._connected:
+            return
+        
         # HTTP transport for queries and mutations
-        http_transport = AIOHTTPTransport(
+        http_transport = _OrjsonHTTPXAsyncTransport(
             url=settings.graphql_url,
             timeout=settings.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, keepalive_expiry=60),
+            json_serialize=_orjson_dumps,
         )
+        # The operations are fixed at import, so skip the introspection round
+        # trip and schema build that fetching the schema costs at startup
         self._http_client = Client(
             transport=http_transport,
-            fetch_schema_from_transport=True,
+            fetch_schema_from_transport=False,
         )
+        self._http_session = await self._http_client.connect_async()
         
         # WebSocket transport for subscriptions
         ws_transport = WebsocketsTransport(url=settings.graphql_ws_url)
         self._ws_client = Client(transport=ws_transport)
+        self._connected = True
     
     async def disconnect(self):
         """Disconnect from GraphQL endpoint."""
+        if not self._connected:
+            return
         if self._http_client:
             await self._http_client.close_async()
         if self._ws_client:
             await self._ws_client.close_async()
+        self._http_session = None
+        self._connected = False
     
     @asynccontextmanager
     async def session(self):
@@ -52,89 +377,100 @@ class GraphQLClient:
         finally:
             await self.disconnect()
     
+    async def _execute(
+        self,
+        query: _PersistedQuery,
+        variable_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a query or mutation, as an automatic persisted query when enabled.
+        
+        Only the document hash is sent; on a cache miss the full text goes out
+        once so the server can store it. A server that rejects the hash-only
+        request in any other way gets the plain document from then on.
+        """
+        if not self._persisted_queries:
+            return await self._http_session.execute(query.document, variable_values=variable_values)
+        
+        payload: Dict[str, Any] = {
+            "operationName": query.operation_name,
+            "extensions": {"persistedQuery": {"version": 1, "sha256Hash": query.sha256}},
+        }
+        if variable_values is not None:
+            payload["variables"] = variable_values
+        try:
+            result = await self._http_session.execute(
+                query.document,
+                variable_values=variable_values,
+                extra_args={"json": payload},
+            )
+        except TransportError as e:
+            code = _apq_error_code(e) if isinstance(e, TransportQueryError) else None
+            if code != "PERSISTED_QUERY_NOT_FOUND":
+                # A server known to support APQ ran the query; its errors are real
+                if self._persisted_queries_confirmed and code is None:
+                    raise
+                self._persisted_queries = False
+                return await self._http_session.execute(query.document, variable_values=variable_values)
+        else:
+            self._persisted_queries_confirmed = True
+            return result
+        
+        # Register the document under its hash
+        result = await self._http_session.execute(
+            query.document,
+            variable_values=variable_values,
+            extra_args={"json": {**payload, "query": query.text}},
+        )
+        self._persisted_queries_confirmed = True
+        return result
+    
     # === Queries ===
     
     async def list_graphs(self) -> List[Graph]:
         """List all graphs."""
-        query = gql("""
-            query ListGraphs {
-                graphs {
-                    id
-                    name
-                    description
-                    status
-                    createdAt
-                    updatedAt
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(query)
+        result = await self._execute(_QUERY_LIST_GRAPHS)
+        return [self._parse_graph(g) for g in result.get("graphs", [])]
+    
+    async def list_graphs_detailed(self) -> List[Graph]:
+        """List all graphs with their nodes and edges in one round trip."""
+        result = await self._execute(_QUERY_LIST_GRAPHS_DETAILED)
         return [self._parse_graph(g) for g in result.get("graphs", [])]
     
     async def get_graph(self, graph_id: str) -> Optional[Graph]:
-        """Get graph by ID with all nodes and edges."""
-        query = gql("""
-            query GetGraph($id: ID!) {
-                graph(id: $id) {
-                    id
-                    name
-                    description
-                    status
-                    createdAt
-                    updatedAt
-                    nodes {
-                        id
-                        name
-                        type
-                        description
-                        position { x, y }
-                        config
-                        status
-                        parentIds
-                        childIds
-                        startedAt
-                        completedAt
-                        errorMessage
-                        result
-                    }
-                    edges {
-                        id
-                        sourceId
-                        targetId
-                        label
-                    }
-                }
-            }
-        """)
+        """Get graph by ID with all nodes and edges.
         
-        result = await self._http_client.execute_async(query, variable_values={"id": graph_id})
+        Served from a short-lived cache when the same graph was fetched less
+        than _GRAPH_CACHE_TTL seconds ago; mutations invalidate it.
+        """
+        cached = self._graph_cache.get(graph_id)
+        if cached and time.monotonic() - cached[0] < _GRAPH_CACHE_TTL:
+            self._graph_cache.move_to_end(graph_id)
+            return cached[1]
+        
+        result = await self._execute(_QUERY_GET_GRAPH, variable_values={"id": graph_id})
         graph_data = result.get("graph")
-        return self._parse_graph(graph_data) if graph_data else None
+        if not graph_data:
+            self._graph_cache.pop(graph_id, None)
+            return None
+        
+        graph = self._parse_graph(graph_data)
+        self._graph_cache[graph_id] = (time.monotonic(), graph)
+        self._graph_cache.move_to_end(graph_id)
+        if len(self._graph_cache) > _GRAPH_CACHE_SIZE:
+            self._graph_cache.popitem(last=False)
+        return graph
+    
+    def invalidate(self, graph_id: Optional[str] = None) -> None:
+        """Drop the cached get_graph() result for graph_id, or all of them."""
+        if graph_id is None:
+            self._graph_cache.clear()
+        else:
+            self._graph_cache.pop(graph_id, None)
     
     async def get_execution_status(self, graph_id: str) -> Optional[Execution]:
         """Get current execution status."""
-        query = gql("""
-            query GetExecution($graphId: ID!) {
-                execution(graphId: $graphId) {
-                    id
-                    graphId
-                    status
-                    startedAt
-                    completedAt
-                    progress
-                    logs {
-                        timestamp
-                        nodeId
-                        level
-                        message
-                    }
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            query, 
+        result = await self._execute(
+            _QUERY_GET_EXECUTION, 
             variable_values={"graphId": graph_id}
         )
         exec_data = result.get("execution")
@@ -144,19 +480,8 @@ class GraphQLClient:
     
     async def create_graph(self, name: str, description: Optional[str] = None) -> Graph:
         """Create new graph."""
-        mutation = gql("""
-            mutation CreateGraph($input: CreateGraphInput!) {
-                createGraph(input: $input) {
-                    id
-                    name
-                    description
-                    status
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_CREATE_GRAPH,
             variable_values={
                 "input": {"name": name, "description": description}
             }
@@ -172,21 +497,8 @@ class GraphQLClient:
         config: Optional[Dict[str, Any]] = None
     ) -> Node:
         """Create new node."""
-        mutation = gql("""
-            mutation CreateNode($input: CreateNodeInput!) {
-                createNode(input: $input) {
-                    id
-                    name
-                    type
-                    position { x, y }
-                    config
-                    status
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_CREATE_NODE,
             variable_values={
                 "input": {
                     "graphId": graph_id,
@@ -197,6 +509,7 @@ class GraphQLClient:
                 }
             }
         )
+        self.invalidate(graph_id)
         return self._parse_node(result["createNode"])
     
     async def update_node(
@@ -207,18 +520,6 @@ class GraphQLClient:
         config: Optional[Dict[str, Any]] = None
     ) -> Node:
         """Update node."""
-        mutation = gql("""
-            mutation UpdateNode($id: ID!, $input: UpdateNodeInput!) {
-                updateNode(id: $id, input: $input) {
-                    id
-                    name
-                    type
-                    position { x, y }
-                    config
-                }
-            }
-        """)
-        
         update_data = {}
         if name is not None:
             update_data["name"] = name
@@ -227,89 +528,79 @@ class GraphQLClient:
         if config is not None:
             update_data["config"] = config
         
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_UPDATE_NODE,
             variable_values={"id": node_id, "input": update_data}
         )
+        # Only the node id is known here, so drop every cached graph
+        self.invalidate()
         return self._parse_node(result["updateNode"])
     
     async def delete_node(self, node_id: str) -> bool:
         """Delete node."""
-        mutation = gql("""
-            mutation DeleteNode($id: ID!) {
-                deleteNode(id: $id)
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_DELETE_NODE,
             variable_values={"id": node_id}
         )
+        self.invalidate()
         return result.get("deleteNode", False)
     
     async def connect_nodes(self, source_id: str, target_id: str) -> str:
         """Connect two nodes."""
-        mutation = gql("""
-            mutation ConnectNodes($input: ConnectNodesInput!) {
-                connectNodes(input: $input) {
-                    id
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_CONNECT_NODES,
             variable_values={
                 "input": {"sourceId": source_id, "targetId": target_id}
             }
         )
+        self.invalidate()
         return result["connectNodes"]["id"]
     
     async def execute_graph(self, graph_id: str) -> str:
         """Execute graph."""
-        mutation = gql("""
-            mutation ExecuteGraph($graphId: ID!) {
-                executeGraph(graphId: $graphId) {
-                    id
-                }
-            }
-        """)
-        
-        result = await self._http_client.execute_async(
-            mutation,
+        result = await self._execute(
+            _MUTATION_EXECUTE_GRAPH,
             variable_values={"graphId": graph_id}
         )
+        self.invalidate(graph_id)
         return result["executeGraph"]["id"]
     
     # === Subscriptions ===
     
+    @property
+    def reports_node_statuses(self) -> bool:
+        """Whether execution updates carry node statuses."""
+        return bool(self._node_statuses_supported)
+    
     async def subscribe_execution_updates(
         self, 
         graph_id: str
     ) -> AsyncIterator[Execution]:
-        """Subscribe to execution updates."""
-        subscription = gql("""
-            subscription ExecutionUpdates($graphId: ID!) {
-                executionUpdates(graphId: $graphId) {
-                    id
-                    graphId
-                    status
-                    startedAt
-                    completedAt
-                    progress
-                    logs {
-                        timestamp
-                        nodeId
-                        level
-                        message
-                    }
-                }
-            }
-        """)
+        """Subscribe to execution updates.
+        
+        Node statuses are requested while the server is not known to lack
+        them; if it rejects the field, the subscription is reopened without
+        it and reports_node_statuses stays False.
+        """
+        variable_values = {"graphId": graph_id}
+        if self._node_statuses_supported is not False:
+            try:
+                async for result in self._ws_client.subscribe_async(
+                    _SUB_EXECUTION_UPDATES_WITH_NODE_STATUSES,
+                    variable_values=variable_values
+                ):
+                    self._node_statuses_supported = True
+                    yield self._parse_execution(result["executionUpdates"])
+                return
+            except TransportQueryError as e:
+                # Only a validation error on the field itself, before any update
+                if self._node_statuses_supported or "nodeStatuses" not in str(e):
+                    raise
+                self._node_statuses_supported = False
         
         async for result in self._ws_client.subscribe_async(
-            subscription,
-            variable_values={"graphId": graph_id}
+            _SUB_EXECUTION_UPDATES,
+            variable_values=variable_values
         ):
             yield self._parse_execution(result["executionUpdates"])
     
@@ -317,33 +608,34 @@ class GraphQLClient:
     
     def _parse_graph(self, data: Dict[str, Any]) -> Graph:
         """Parse graph data."""
-        return Graph(**self._camel_to_snake(data))
+        return _GRAPH_ADAPTER.validate_python(self._camel_to_snake(data))
     
     def _parse_node(self, data: Dict[str, Any]) -> Node:
         """Parse node data."""
-        return Node(**self._camel_to_snake(data))
+        return _NODE_ADAPTER.validate_python(self._camel_to_snake(data))
     
     def _parse_execution(self, data: Dict[str, Any]) -> Execution:
         """Parse execution data."""
-        return Execution(**self._camel_to_snake(data))
+        return _EXECUTION_ADAPTER.validate_python(self._camel_to_snake(data))
     
     def _camel_to_snake(self, data: Any) -> Any:
-        """Convert camelCase keys to snake_case recursively."""
-        if isinstance(data, dict):
-            return {
-                self._to_snake(k): self._camel_to_snake(v) 
-                for k, v in data.items()
-            }
-        elif isinstance(data, list):
-            return [self._camel_to_snake(item) for item in data]
+        """Convert camelCase keys to snake_case throughout, in place.
+        
+        Responses are freshly decoded and owned by us, so keys are renamed on
+        the existing containers instead of rebuilding a copy of the payload.
+        """
+        stack = [data]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, dict):
+                for key in list(obj):
+                    value = obj.pop(key)
+                    obj[_to_snake(key)] = value
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(obj, list):
+                stack.extend(item for item in obj if isinstance(item, (dict, list)))
         return data
-    
-    @staticmethod
-    def _to_snake(name: str) -> str:
-        """Convert camelCase to snake_case."""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
 # Global client instance
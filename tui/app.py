@@ -44,7 +44,9 @@ class GraphTUIApp(App):
     async def _load_graph_selection(self) -> None:
         """Load graph selection screen."""
         try:
-            graphs = await client.list_graphs()
+            # Graphs come back with full detail so the first one can be
+            # shown without a second get_graph round trip
+            graphs = await client.list_graphs_detailed()
             
             if not graphs:
                 # Create a demo graph
@@ -57,8 +59,7 @@ class GraphTUIApp(App):
             else:
                 # Load first graph for now
                 # TODO: Implement graph selection screen
-                graph = await client.get_graph(graphs[0].id)
-                self.current_graph = graph
+                self.current_graph = graphs[0]
             
             # Push main screen
             if self.current_graph:
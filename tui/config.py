@@ -16,6 +16,10 @@ class Settings(BaseSettings):
     # API Timeouts
     timeout: int = 30
     
+    # Send queries as automatic persisted queries (hash first); only servers
+    # with APQ support accept those, so this is opt-in
+    persisted_queries: bool = False
+    
     # UI Configuration
     refresh_rate: int = 2  # seconds for polling execution status
     max_nodes_display: int = 1000  # limit for performance
@@ -2,8 +2,8 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # === Node Models ===
@@ -74,30 +74,146 @@ class Graph(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    # id -> node, built on first lookup; call invalidate_node_index() after
+    # changing self.nodes
+    _node_index: Optional[Dict[str, Node]] = PrivateAttr(default=None)
+    _roots: Optional[List[Node]] = PrivateAttr(default=None)
+    _version: int = PrivateAttr(default=0)
+    # (version, node count, edge count) the resolved edge list was built at
+    _resolved_key: Optional[Tuple[int, int, int]] = PrivateAttr(default=None)
+    _resolved_edges: List[Tuple[Node, Node]] = PrivateAttr(default_factory=list)
+    # (version, node count, max x, max y) as of the last max_position() call
+    _extent: Optional[Tuple[int, int, int, int]] = PrivateAttr(default=None)
+    
+    # node id -> ids of its outgoing/incoming edges; kept in step with
+    # self.edges by add_edge() and remove_node()
+    _edges_by_id: Dict[str, Edge] = PrivateAttr(default_factory=dict)
+    _edges_by_source: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    _edges_by_target: Dict[str, Set[str]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the edge indexes."""
+        for edge in self.edges:
+            self._index_edge(edge)
+    
+    def _index_edge(self, edge: Edge) -> None:
+        self._edges_by_id[edge.id] = edge
+        self._edges_by_source.setdefault(edge.source_id, set()).add(edge.id)
+        self._edges_by_target.setdefault(edge.target_id, set()).add(edge.id)
+    
+    def _ensure_node_index(self) -> Dict[str, Node]:
+        if self._node_index is None or len(self._node_index) != len(self.nodes):
+            self._node_index = {node.id: node for node in self.nodes}
+            self._roots = None
+        return self._node_index
+    
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        return self._ensure_node_index().get(node_id)
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every local change, for render caches."""
+        return self._version
+    
+    def resolved_edges(self) -> List[Tuple[Node, Node]]:
+        """(source, target) nodes of every edge whose endpoints both exist.
+        
+        Rebuilt only after the graph changed. Do not modify.
+        """
+        key = (self._version, len(self.nodes), len(self.edges))
+        if key != self._resolved_key:
+            nodes = self._ensure_node_index()
+            self._resolved_edges = [
+                (source, target)
+                for edge in self.edges
+                if (source := nodes.get(edge.source_id)) and (target := nodes.get(edge.target_id))
+            ]
+            self._resolved_key = key
+        return self._resolved_edges
+    
+    def max_position(self) -> Tuple[int, int]:
+        """Largest node x and y, (0, 0) for an empty graph.
+        
+        Recomputed only after the graph changed; code that moves nodes must
+        call mark_changed().
+        """
+        extent = self._extent
+        if extent is None or extent[0] != self._version or extent[1] != len(self.nodes):
+            max_x = max((n.position.x for n in self.nodes), default=0)
+            max_y = max((n.position.y for n in self.nodes), default=0)
+            extent = self._extent = (self._version, len(self.nodes), max_x, max_y)
+        return extent[2], extent[3]
+    
+    def mark_changed(self) -> None:
+        """Record a change made in place, e.g. nodes moved by a layout."""
+        self._version += 1
+    
+    def invalidate_node_index(self) -> None:
+        """Drop the node index after nodes were added, replaced or removed."""
+        self._node_index = None
+        self._roots = None
+        self._version += 1
     
     def get_root_nodes(self) -> List[Node]:
         """Get nodes with no parents."""
-        return [node for node in self.nodes if not node.parent_ids]
+        self._ensure_node_index()
+        if self._roots is None:
+            self._roots = [node for node in self.nodes if not node.parent_ids]
+        return self._roots
+    
+    def add_edge(self, edge: Edge) -> None:
+        """Add an edge and link its endpoints."""
+        self.edges.append(edge)
+        self._index_edge(edge)
+        
+        source = self.get_node(edge.source_id)
+        if source and edge.target_id not in source.child_ids:
+            source.child_ids.append(edge.target_id)
+        target = self.get_node(edge.target_id)
+        if target and edge.source_id not in target.parent_ids:
+            target.parent_ids.append(edge.source_id)
+        self._roots = None
+        self._version += 1
+    
+    def remove_node(self, node_id: str) -> Optional[Node]:
+        """Remove a node and every edge touching it; returns the removed node."""
+        node = self.get_node(node_id)
+        if not node:
+            return None
+        
+        self.nodes = [n for n in self.nodes if n.id != node_id]
+        self.invalidate_node_index()
+        
+        dropped = self._edges_by_source.pop(node_id, set()) | self._edges_by_target.pop(node_id, set())
+        for edge_id in dropped:
+            edge = self._edges_by_id.pop(edge_id)
+            if edge.source_id != node_id:
+                self._edges_by_source[edge.source_id].discard(edge_id)
+                if parent := self.get_node(edge.source_id):
+                    parent.child_ids = [i for i in parent.child_ids if i != node_id]
+            if edge.target_id != node_id:
+                self._edges_by_target[edge.target_id].discard(edge_id)
+                if child := self.get_node(edge.target_id):
+                    child.parent_ids = [i for i in child.parent_ids if i != node_id]
+        
+        if dropped:
+            self.edges = [e for e in self.edges if e.id not in dropped]
+        return node
     
     def get_children(self, node_id: str) -> List[Node]:
         """Get child nodes."""
         node = self.get_node(node_id)
         if not node:
             return []
-        return [self.get_node(child_id) for child_id in node.child_ids if self.get_node(child_id)]
+        return [child for child_id in node.child_ids if (child := self.get_node(child_id))]
     
     def get_parents(self, node_id: str) -> List[Node]:
         """Get parent nodes."""
         node = self.get_node(node_id)
         if not node:
             return []
-        return [self.get_node(parent_id) for parent_id in node.parent_ids if self.get_node(parent_id)]
+        return [parent for parent_id in node.parent_ids if (parent := self.get_node(parent_id))]
 
 
 # === Execution Models ===
@@ -110,6 +226,12 @@ class ExecutionLog(BaseModel):
     message: str
 
 
+class NodeStatusUpdate(BaseModel):
+    """Node status reported by an execution update."""
+    node_id: str
+    status: NodeStatus
+
+
 class Execution(BaseModel):
     """Graph execution model."""
     id: str
@@ -119,6 +241,7 @@ class Execution(BaseModel):
     completed_at: Optional[datetime] = None
     logs: List[ExecutionLog] = Field(default_factory=list)
     progress: float = 0.0  # 0-100
+    node_statuses: List[NodeStatusUpdate] = Field(default_factory=list)
     
     @property
     def duration(self) -> Optional[float]:
@@ -1,12 +1,17 @@
 """Main graph editor screen."""
 
+import asyncio
+import time
+from typing import Set
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer
 from textual.binding import Binding
 
-from graph_tui.models import Graph, Node
+from graph_tui.config import settings
+from graph_tui.models import Edge, Execution, Graph, Node
 from graph_tui.widgets.graph_canvas import GraphCanvas
 from graph_tui.widgets import NodeList, PropertyPanel, ExecutionPanel
 from graph_tui.widgets import CreateNodeModal, EditNodeModal
@@ -69,6 +74,7 @@ class MainScreen(Screen):
         self._execution_task = None
         self._connecting_mode = False
         self._connection_source = None
+        self._refresh_pending = False
     
     def compose(self) -> ComposeResult:
         """Compose screen."""
@@ -119,7 +125,8 @@ class MainScreen(Screen):
                 
                 # Update local graph
                 self.graph.nodes.append(node)
-                await self._refresh_display()
+                self.graph.invalidate_node_index()
+                self._schedule_refresh()
                 
                 self.notify(f"Node '{node.name}' created")
             except Exception as e:
@@ -150,8 +157,9 @@ class MainScreen(Screen):
                     if n.id == node.id:
                         self.graph.nodes[i] = updated_node
                         break
+                self.graph.invalidate_node_index()
                 
-                await self._refresh_display()
+                self._schedule_refresh()
                 self.notify(f"Node '{updated_node.name}' updated")
             except Exception as e:
                 self.notify(f"Error updating node: {e}", severity="error")
@@ -170,13 +178,9 @@ class MainScreen(Screen):
             await client.delete_node(node.id)
             
             # Update local graph
-            self.graph.nodes = [n for n in self.graph.nodes if n.id != node.id]
-            self.graph.edges = [
-                e for e in self.graph.edges 
-                if e.source_id != node.id and e.target_id != node.id
-            ]
+            self.graph.remove_node(node.id)
             
-            await self._refresh_display()
+            self._schedule_refresh()
             self.notify(f"Node '{node.name}' deleted")
         except Exception as e:
             self.notify(f"Error deleting node: {e}", severity="error")
@@ -204,8 +208,14 @@ class MainScreen(Screen):
                             target_id=target_node.id
                         )
                         
-                        # Reload graph to get updated edges
-                        await self._reload_graph()
+                        # Update local graph instead of refetching all of it
+                        self.graph.add_edge(Edge(
+                            id=edge_id,
+                            source_id=self._connection_source,
+                            target_id=target_node.id
+                        ))
+                        
+                        self._schedule_refresh()
                         self.notify("Nodes connected")
                     except Exception as e:
                         self.notify(f"Error connecting nodes: {e}", severity="error")
@@ -229,6 +239,8 @@ class MainScreen(Screen):
     
     async def action_refresh(self) -> None:
         """Refresh graph from server."""
+        # An explicit refresh always goes to the server
+        client.invalidate(self.graph.id)
         await self._reload_graph()
         self.notify("Graph refreshed")
     
@@ -275,10 +287,21 @@ class MainScreen(Screen):
             updated_graph = await client.get_graph(self.graph.id)
             if updated_graph:
                 self.graph = updated_graph
-                await self._refresh_display()
+                self._schedule_refresh()
         except Exception as e:
             self.notify(f"Error reloading graph: {e}", severity="error")
     
+    def _schedule_refresh(self) -> None:
+        """Schedule a display refresh, coalescing requests made within 50 ms."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(0.05, self._do_refresh)
+    
+    async def _do_refresh(self) -> None:
+        """Run the scheduled refresh."""
+        self._refresh_pending = False
+        await self._refresh_display()
+    
     async def _refresh_display(self) -> None:
         """Refresh all display widgets."""
         canvas = self.query_one(GraphCanvas)
@@ -293,6 +316,16 @@ class MainScreen(Screen):
             prop_panel = self.query_one(PropertyPanel)
             prop_panel.set_node(selected)
     
+    def _apply_node_statuses(self, execution: Execution) -> Set[str]:
+        """Apply reported node statuses to the local graph; returns changed node ids."""
+        changed = set()
+        for update in execution.node_statuses:
+            node = self.graph.get_node(update.node_id)
+            if node and node.status != update.status:
+                node.status = update.status
+                changed.add(node.id)
+        return changed
+    
     def _start_execution_monitoring(self) -> None:
         """Start monitoring execution status."""
         if self._execution_task:
@@ -304,17 +337,67 @@ class MainScreen(Screen):
         )
     
     async def _monitor_execution(self) -> None:
-        """Monitor execution via subscription."""
+        """Monitor execution via subscription.
+        
+        Updates are pumped off the socket into a one-slot queue and applied
+        here, so a burst of updates collapses to the latest snapshot instead
+        of queueing one redraw per message.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        pump = asyncio.create_task(self._pump_execution_updates(queue))
+        last_reload = 0.0
         try:
-            async with client.session():
-                async for execution in client.subscribe_execution_updates(self.graph.id):
-                    # Update execution panel
-                    exec_panel = self.query_one(ExecutionPanel)
-                    exec_panel.set_execution(execution)
-                    
-                    # Update graph with node statuses
-                    # (This would need the execution to include node statuses)
-                    await self._reload_graph()
+            while (execution := await queue.get()) is not None:
+                # Update execution panel
+                exec_panel = self.query_one(ExecutionPanel)
+                exec_panel.set_execution(execution)
+                
+                if not client.reports_node_statuses:
+                    # The server sends no node statuses, so refetch the graph,
+                    # at most once per refresh_rate
+                    if time.monotonic() - last_reload >= settings.refresh_rate:
+                        last_reload = time.monotonic()
+                        await self._reload_graph()
+                    continue
+                
+                # Update graph with node statuses from the payload
+                # rather than refetching the whole graph per update
+                changed = self._apply_node_statuses(execution)
+                if changed:
+                    # Statuses don't move anything, so the canvas only
+                    # redraws the affected node boxes
+                    self.query_one(GraphCanvas).mark_nodes_dirty(changed)
+                    self.query_one(NodeList).mutate_reactive(NodeList.graph)
+                    self.query_one(PropertyPanel).refresh()
+            
+            if not client.reports_node_statuses:
+                # Pick up the final statuses the throttle may have skipped
+                client.invalidate(self.graph.id)
+                await self._reload_graph()
         except Exception as e:
-            # Silently fail or log
-            pass
\ No newline at end of file
+            self.log.error(f"Execution monitoring failed: {e!r}")
+            self.notify(f"Error monitoring execution: {e}", severity="error")
+        finally:
+            pump.cancel()
+    
+    async def _pump_execution_updates(self, queue: asyncio.Queue) -> None:
+        """Feed subscription updates into queue, replacing any unconsumed one."""
+        try:
+            # Runs on the app-wide connection opened in on_mount
+            async for execution in client.subscribe_execution_updates(self.graph.id):
+                if queue.full():
+                    # Each update carries the full execution, so the older one
+                    # can go; only keep node statuses the newer one omits
+                    stale = queue.get_nowait()
+                    reported = {update.node_id for update in execution.node_statuses}
+                    execution.node_statuses[:0] = [
+                        update for update in stale.node_statuses
+                        if update.node_id not in reported
+                    ]
+                queue.put_nowait(execution)
+        except Exception as e:
+            self.log.error(f"Execution subscription failed: {e!r}")
+            self.notify(f"Execution updates stopped: {e}", severity="error")
+        
+        # Tell the consumer the subscription is over
+        await queue.put(None)
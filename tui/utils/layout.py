@@ -1,9 +1,11 @@
 """Graph layout algorithms for positioning nodes."""
 
-from typing import Dict, List, Tuple
-import networkx as nx
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 
-from graph_tui.models import Graph, Node, NodePosition
+from graph_tui.models import Edge, Graph, Node, NodePosition
 from graph_tui.config import settings
 
 
@@ -16,34 +18,20 @@ def calculate_hierarchical_layout(graph: Graph) -> Dict[str, NodePosition]:
     if not graph.nodes:
         return {}
     
-    # Create NetworkX graph
-    G = nx.DiGraph()
-    
-    # Add nodes
-    for node in graph.nodes:
-        G.add_node(node.id)
-    
-    # Add edges
-    for edge in graph.edges:
-        G.add_edge(edge.source_id, edge.target_id)
-    
     # Calculate layers (topological sort with depth)
-    try:
-        layers = _calculate_layers(G)
-    except nx.NetworkXError:
+    layers = _calculate_layers(graph)
+    if layers is None:
         # Graph has cycles, fall back to simple layout
         return _calculate_simple_layout(graph)
     
     # Position nodes by layer
     positions = {}
-    layer_counts = {}
+    layer_counts = [0] * (max(layers.values()) + 1)
+    spacing_x, spacing_y = settings.node_spacing_x, settings.node_spacing_y
     
     for node_id, layer in layers.items():
-        if layer not in layer_counts:
-            layer_counts[layer] = 0
-        
-        x = layer * settings.node_spacing_x
-        y = layer_counts[layer] * settings.node_spacing_y
+        x = layer * spacing_x
+        y = layer_counts[layer] * spacing_y
         
         positions[node_id] = NodePosition(x=x, y=y)
         layer_counts[layer] += 1
@@ -51,21 +39,44 @@ def calculate_hierarchical_layout(graph: Graph) -> Dict[str, NodePosition]:
     return positions
 
 
-def _calculate_layers(G: nx.DiGraph) -> Dict[str, int]:
-    """Calculate layer for each node (longest path from root)."""
-    layers = {}
+def _calculate_layers(graph: Graph) -> Optional[Dict[str, int]]:
+    """Calculate layer for each node (longest path from root).
+    
+    Kahn's algorithm over integer node indices: a node's layer is settled
+    once its last predecessor is popped. Returns None if the graph has a cycle.
+    """
+    node_ids = [node.id for node in graph.nodes]
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
     
-    # Get topological order
-    topo_order = list(nx.topological_sort(G))
+    successors: List[List[int]] = [[] for _ in node_ids]
+    indegree = [0] * len(node_ids)
+    for edge in graph.edges:
+        source = index.get(edge.source_id)
+        target = index.get(edge.target_id)
+        if source is None or target is None:
+            continue
+        successors[source].append(target)
+        indegree[target] += 1
+    
+    depth = [0] * len(node_ids)
+    queue = deque(i for i, degree in enumerate(indegree) if degree == 0)
+    layers = {}
     
-    # Calculate longest path to each node
-    for node in topo_order:
-        predecessors = list(G.predecessors(node))
-        if not predecessors:
-            layers[node] = 0
-        else:
-            layers[node] = max(layers[p] for p in predecessors) + 1
+    while queue:
+        u = queue.popleft()
+        layer = depth[u]
+        layers[node_ids[u]] = layer
+        # Push the layer forward instead of taking a max over predecessors
+        layer += 1
+        for v in successors[u]:
+            if layer > depth[v]:
+                depth[v] = layer
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue.append(v)
     
+    if len(layers) < len(node_ids):
+        return None
     return layers
 
 
@@ -98,28 +109,74 @@ def calculate_force_directed_layout(
     if not graph.nodes:
         return {}
     
-    # Create NetworkX graph
-    G = nx.DiGraph()
-    for node in graph.nodes:
-        G.add_node(node.id)
-    for edge in graph.edges:
-        G.add_edge(edge.source_id, edge.target_id)
+    index = {node.id: i for i, node in enumerate(graph.nodes)}
+    edge_index = np.array(
+        [
+            (index[edge.source_id], index[edge.target_id])
+            for edge in graph.edges
+            if edge.source_id in index and edge.target_id in index
+            and edge.source_id != edge.target_id
+        ],
+        dtype=np.intp
+    ).reshape(-1, 2)
     
     # Calculate layout
-    pos = nx.spring_layout(G, iterations=iterations, seed=42)
+    coords = _fruchterman_reingold(len(graph.nodes), edge_index, iterations)
     
     # Convert to our position format (scale up for terminal)
-    positions = {}
     scale = 50  # Scale factor for terminal
     
-    for node_id, (x, y) in pos.items():
-        # Normalize to positive coordinates
-        positions[node_id] = NodePosition(
-            x=int((x + 1) * scale),
-            y=int((y + 1) * scale)
-        )
+    # Normalize to positive coordinates, all nodes in one array op
+    coords = ((coords + 1.0) * scale).astype(np.int32)
     
-    return positions
+    return {
+        node.id: NodePosition(x=int(x), y=int(y))
+        for node, (x, y) in zip(graph.nodes, coords.tolist())
+    }
+
+
+def _fruchterman_reingold(n: int, edge_index: np.ndarray, iterations: int) -> np.ndarray:
+    """Fruchterman-Reingold spring layout on NumPy arrays.
+    
+    Returns an (n, 2) array centred on the origin and scaled into [-1, 1].
+    Repulsion is computed for all pairs at once from squared distances
+    (k^2 / d^2 along the offset vector, so no square roots); attraction only
+    along edges, accumulated with np.add.at.
+    """
+    pos = np.random.default_rng(42).random((n, 2))
+    if n < 2:
+        return np.zeros((n, 2))
+    
+    k = np.sqrt(1.0 / n)
+    k2 = k * k
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+    sources, targets = edge_index[:, 0], edge_index[:, 1]
+    
+    for _ in range(iterations):
+        delta = pos[:, None, :] - pos[None, :, :]
+        dist2 = np.einsum('ijk,ijk->ij', delta, delta)
+        np.maximum(dist2, 1e-4, out=dist2)
+        
+        # Repulsion between every pair (the diagonal has zero offset)
+        disp = np.einsum('ijk,ij->ik', delta, k2 / dist2)
+        
+        # Attraction along edges, pulling both endpoints together
+        edge_delta = delta[sources, targets]
+        pull = edge_delta * (np.sqrt(dist2[sources, targets]) / k)[:, None]
+        np.add.at(disp, sources, -pull)
+        np.add.at(disp, targets, pull)
+        
+        length = np.sqrt(np.einsum('ij,ij->i', disp, disp))
+        np.maximum(length, 0.01, out=length)
+        pos += disp * (temperature / length)[:, None]
+        temperature -= cooling
+    
+    pos -= pos.mean(axis=0)
+    extent = np.abs(pos).max()
+    if extent > 0:
+        pos /= extent
+    return pos
 
 
 def auto_layout_graph(graph: Graph, layout_type: str = "hierarchical") -> Graph:
@@ -133,21 +190,51 @@ def auto_layout_graph(graph: Graph, layout_type: str = "hierarchical") -> Graph:
     Returns:
         Graph with updated node positions
     """
-    if layout_type == "hierarchical":
-        positions = calculate_hierarchical_layout(graph)
-    elif layout_type == "force":
-        positions = calculate_force_directed_layout(graph)
-    else:
-        positions = _calculate_simple_layout(graph)
+    node_ids = tuple(node.id for node in graph.nodes)
+    edge_pairs = tuple((edge.source_id, edge.target_id) for edge in graph.edges)
+    positions = {node_id: (x, y) for node_id, x, y in _cached_layout(layout_type, node_ids, edge_pairs)}
     
     # Update node positions
     for node in graph.nodes:
         if node.id in positions:
-            node.position = positions[node.id]
+            x, y = positions[node.id]
+            node.position = NodePosition(x=x, y=y)
+    graph.mark_changed()
     
     return graph
 
 
+@lru_cache(maxsize=32)
+def _cached_layout(
+    layout_type: str,
+    node_ids: Tuple[str, ...],
+    edge_pairs: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, int, int], ...]:
+    """Compute a layout for the given topology.
+    
+    Every layout is deterministic in node order and edges, so reloading an
+    unchanged graph reuses the previous result instead of laying it out again.
+    """
+    skeleton = Graph(
+        id="",
+        name="",
+        nodes=[Node(id=node_id, name="", type="") for node_id in node_ids],
+        edges=[
+            Edge(id=str(i), source_id=source_id, target_id=target_id)
+            for i, (source_id, target_id) in enumerate(edge_pairs)
+        ]
+    )
+    
+    if layout_type == "hierarchical":
+        positions = calculate_hierarchical_layout(skeleton)
+    elif layout_type == "force":
+        positions = calculate_force_directed_layout(skeleton)
+    else:
+        positions = _calculate_simple_layout(skeleton)
+    
+    return tuple((node_id, pos.x, pos.y) for node_id, pos in positions.items())
+
+
 def optimize_node_spacing(graph: Graph, min_spacing: int = 5) -> Graph:
     """
     Optimize node spacing to avoid overlaps.
@@ -157,20 +244,41 @@ def optimize_node_spacing(graph: Graph, min_spacing: int = 5) -> Graph:
     if len(graph.nodes) < 2:
         return graph
     
-    # Sort nodes by position
-    nodes_sorted = sorted(graph.nodes, key=lambda n: (n.position.y, n.position.x))
+    # Positions as parallel coordinate arrays; sort by (y, x)
+    xs = np.fromiter((n.position.x for n in graph.nodes), dtype=np.int64, count=len(graph.nodes))
+    ys = np.fromiter((n.position.y for n in graph.nodes), dtype=np.int64, count=len(graph.nodes))
+    order = np.lexsort((xs, ys)).tolist()
+    
+    # The overlap pass is scalar, where plain ints beat NumPy scalars
+    xs, ys = xs.tolist(), ys.tolist()
+    
+    # Adjust positions to avoid overlaps. Placed nodes are bucketed into
+    # cells one spacing box wide and tall, so any overlapping node lies in
+    # the 3x3 block of cells around the candidate position.
+    cell_w = settings.node_spacing_x
+    grid: Dict[Tuple[int, int], List[int]] = {}
     
-    # Adjust positions to avoid overlaps
-    adjusted = []
-    for node in nodes_sorted:
+    def overlaps(x: int, y: int) -> bool:
+        cx, cy = x // cell_w, y // min_spacing
+        return any(
+            abs(x - xs[j]) < cell_w and abs(y - ys[j]) < min_spacing
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for j in grid.get((cx + dx, cy + dy), ())
+        )
+    
+    for i in order:
+        x, y = xs[i], ys[i]
         # Check for overlaps with already adjusted nodes
-        while any(
-            abs(node.position.x - other.position.x) < settings.node_spacing_x and
-            abs(node.position.y - other.position.y) < min_spacing
-            for other in adjusted
-        ):
-            node.position.y += min_spacing
-        
-        adjusted.append(node)
+        while overlaps(x, y):
+            y += min_spacing
+        ys[i] = y
+        grid.setdefault((x // cell_w, y // min_spacing), []).append(i)
     
-    return graph
\ No newline at end of file
+    # Write back the nodes that moved
+    for node, y in zip(graph.nodes, ys):
+        if node.position.y != y:
+            node.position.y = y
+    graph.mark_changed()
+    
+    return graph
@@ -1,6 +1,9 @@
 """Graph canvas widget for visualizing and interacting with graphs."""
 
-from typing import Optional, Set, Tuple
+import sys
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Set, Tuple
+import numpy as np
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Static
@@ -14,6 +17,152 @@ from rich.text import Text
 from graph_tui.models import Graph, Node, NodeStatus
 
 
+# The canvas is one flat uint32 buffer of code points; rows are recovered by
+# decoding the raw buffer as UTF-32 in native byte order
+_CELL_CODEC = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+_SPACE = ord(' ')
+
+_H_LINE = ord('─')
+_V_LINE = ord('│')
+_CORNER_DOWN = ord('└')
+_CORNER_UP = ord('┘')
+_ARROW = ord('►')
+
+_STATUS_CHARS = {
+    NodeStatus.PENDING: '○',
+    NodeStatus.RUNNING: '◐',
+    NodeStatus.SUCCESS: '●',
+    NodeStatus.FAILURE: '✗',
+    NodeStatus.SKIPPED: '⊘',
+}
+
+_NODE_WIDTH = 20
+_NODE_HEIGHT = 3
+
+
+def _encode(text: str) -> np.ndarray:
+    """Code points of text as canvas cells."""
+    return np.frombuffer(text.encode(_CELL_CODEC), dtype=np.uint32)
+
+
+def _box_template(corners: str, h_line: str, v_line: str) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Pre-encode the top and bottom rows of a node box plus its side glyph."""
+    top = _encode(corners[0] + h_line * (_NODE_WIDTH - 2) + corners[1])
+    bottom = _encode(corners[2] + h_line * (_NODE_WIDTH - 2) + corners[3])
+    return top, bottom, ord(v_line)
+
+
+# selected -> (top row, bottom row, side glyph)
+_BOX_TEMPLATES = {
+    True: _box_template('╔╗╚╝', '═', '║'),
+    False: _box_template('┌┐└┘', '─', '│'),
+}
+
+
+def _draw_edges_kernel(cells: np.ndarray, stride: int, coords: np.ndarray) -> None:
+    """Draw every edge in one pass; coords holds (x1, y1, x2, y2) rows.
+    
+    Same strokes as GraphCanvas._draw_edge, written as plain integer loops
+    so Numba can compile it. Cells outside the canvas are skipped.
+    """
+    size = cells.shape[0]
+    for e in range(coords.shape[0]):
+        x1, y1, x2, y2 = coords[e, 0], coords[e, 1], coords[e, 2], coords[e, 3]
+        top, bottom = min(y1, y2), max(y1, y2)
+        
+        if x1 == x2:
+            for y in range(top, bottom + 1):
+                off = y * stride + x1
+                if 0 <= off < size and cells[off] == _SPACE:
+                    cells[off] = _V_LINE
+        elif y1 == y2:
+            for x in range(min(x1, x2), max(x1, x2) + 1):
+                off = y1 * stride + x
+                if 0 <= off < size and cells[off] == _SPACE:
+                    cells[off] = _H_LINE
+        else:
+            for x in range(x1, x2):
+                off = y1 * stride + x
+                if 0 <= off < size and cells[off] == _SPACE:
+                    cells[off] = _H_LINE
+            for y in range(top, bottom + 1):
+                off = y * stride + x2
+                if 0 <= off < size and cells[off] == _SPACE:
+                    cells[off] = _V_LINE
+            off = y1 * stride + x2
+            if 0 <= off < size:
+                cells[off] = _CORNER_DOWN if y2 > y1 else _CORNER_UP
+        
+        off = y2 * stride + x2
+        if x2 < stride and 0 <= off < size:
+            cells[off] = _ARROW
+
+
+def _draw_edges_batched(canvas: np.ndarray, stride: int, coords: np.ndarray) -> None:
+    """Vectorised equivalent of _draw_edges_kernel for a blank canvas.
+    
+    Every edge contributes up to two line runs and two single glyphs (corner,
+    arrow). All run cells are expanded into one offset array; where lines
+    cross, the first edge drawn keeps the cell, while corners and arrows
+    overwrite lines and the last one drawn wins, as with sequential drawing.
+    """
+    x1, y1, x2, y2 = coords.T
+    top, bottom = np.minimum(y1, y2), np.maximum(y1, y2)
+    vertical = x1 == x2
+    horizontal = ~vertical & (y1 == y2)
+    bent = ~vertical & ~horizontal
+    
+    # Runs per edge as (first run, second run); a bent edge draws its
+    # horizontal leg to the target column, then the vertical leg
+    starts = np.stack([
+        np.where(vertical, top * stride + x1,
+                 np.where(horizontal, y1 * stride + np.minimum(x1, x2), y1 * stride + x1)),
+        top * stride + x2,
+    ], axis=1).ravel()
+    lengths = np.stack([
+        np.where(vertical, bottom - top + 1,
+                 np.where(horizontal, np.abs(x2 - x1) + 1, np.maximum(x2 - x1, 0))),
+        np.where(bent, bottom - top + 1, 0),
+    ], axis=1).ravel()
+    steps = np.stack([np.where(vertical, stride, 1), np.full_like(x1, stride)], axis=1).ravel()
+    glyphs = np.stack([np.where(vertical, _V_LINE, _H_LINE), np.full_like(x1, _V_LINE)], axis=1).ravel()
+    
+    total = int(lengths.sum())
+    if total:
+        run_start = np.cumsum(lengths) - lengths
+        step_no = np.arange(total) - np.repeat(run_start, lengths)
+        offsets = np.repeat(starts, lengths) + step_no * np.repeat(steps, lengths)
+        cell_glyphs = np.repeat(glyphs, lengths)
+        inside = (offsets >= 0) & (offsets < canvas.shape[0])
+        offsets, cell_glyphs = offsets[inside], cell_glyphs[inside]
+        # First write wins: np.unique reports each offset's first occurrence
+        offsets, first = np.unique(offsets, return_index=True)
+        canvas[offsets] = cell_glyphs[first]
+    
+    # Corner then arrow per edge; later glyphs overwrite earlier ones
+    points = np.stack([y1 * stride + x2, y2 * stride + x2], axis=1).ravel()
+    point_glyphs = np.stack([np.where(y2 > y1, _CORNER_DOWN, _CORNER_UP), np.full_like(x1, _ARROW)], axis=1).ravel()
+    drawn = np.stack([bent, x2 < stride], axis=1).ravel()
+    drawn &= (points >= 0) & (points < canvas.shape[0])
+    points, point_glyphs = points[drawn][::-1], point_glyphs[drawn][::-1]
+    points, last = np.unique(points, return_index=True)
+    canvas[points] = point_glyphs[last]
+
+
+@lru_cache(maxsize=None)
+def _edge_drawer() -> Callable[[np.ndarray, int, np.ndarray], None]:
+    """Numba-compiled _draw_edges_kernel, or _draw_edges_batched without numba.
+    
+    Resolved on the first render rather than at import: importing numba
+    alone takes longer than starting the rest of the TUI.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _draw_edges_batched
+    return njit(cache=True)(_draw_edges_kernel)
+
+
 class GraphCanvas(Static):
     """Canvas for displaying and interacting with graph nodes."""
     
@@ -51,6 +200,19 @@ class GraphCanvas(Static):
         self._offset_y = 0
         self._connecting_mode = False
         self._connection_source: Optional[str] = None
+        self._last_render_key: Optional[tuple] = None
+        self._last_panel: Optional[Panel] = None
+        self._canvas_buf: Optional[np.ndarray] = None
+        # Position of the selected node in graph.nodes, when known
+        self._selected_idx = -1
+        # What the canvas buffer currently holds, for partial redraws: the
+        # graph and its (version, stride, size), the selection it was drawn
+        # with, its decoded rows, and nodes changed since then
+        self._drawn_graph: Optional[Graph] = None
+        self._drawn_key: Optional[Tuple[int, int, int]] = None
+        self._drawn_selected: Optional[str] = None
+        self._drawn_lines: list[str] = []
+        self._dirty_nodes: Set[str] = set()
     
     def render(self) -> RenderableType:
         """Render the canvas."""
@@ -61,133 +223,137 @@ class GraphCanvas(Static):
                 border_style="blue"
             )
         
+        # Reuse the last panel unless the graph, selection or a node changed
+        key = (id(self.graph), self.graph.version, self.graph.name, self.selected_node_id)
+        if key == self._last_render_key and not self._dirty_nodes:
+            return self._last_panel
+        
         # Create a text-based representation of the graph
         lines = self._render_graph()
-        return Panel(
+        self._last_panel = Panel(
             "\n".join(lines),
             title=f"Graph: {self.graph.name}",
             border_style="blue"
         )
+        self._last_render_key = key
+        return self._last_panel
     
     def _render_graph(self) -> list[str]:
         """Render graph as ASCII art."""
         if not self.graph:
             return []
         
+        # Only node boxes changed since the buffer was drawn: redraw those
+        if self._drawn_graph is self.graph and self._drawn_key[0] == self.graph.version:
+            return self._redraw_nodes()
+        
         # Calculate canvas size
-        max_x = max((n.position.x for n in self.graph.nodes), default=0) + 30
-        max_y = max((n.position.y for n in self.graph.nodes), default=0) + 10
+        max_x, max_y = self.graph.max_position()
+        max_x += 30
+        max_y += 10
         
-        # Create empty canvas
-        canvas = [[' ' for _ in range(max_x)] for _ in range(max_y)]
+        # Clear a canvas in the pooled buffer, growing it only when needed
+        size = max_x * max_y
+        if self._canvas_buf is None or len(self._canvas_buf) < size:
+            self._canvas_buf = np.empty(size, dtype=np.uint32)
+        canvas = self._canvas_buf[:size]
+        canvas.fill(_SPACE)
         
         # Draw edges first (so they appear behind nodes)
-        for edge in self.graph.edges:
-            source = self.graph.get_node(edge.source_id)
-            target = self.graph.get_node(edge.target_id)
-            if source and target:
-                self._draw_edge(canvas, source, target)
+        endpoints = self.graph.resolved_edges()
+        if endpoints:
+            # Edges run from the middle of the source to the target's left side
+            coords = np.array(
+                [
+                    (s.position.x + 10, s.position.y + 1, t.position.x, t.position.y + 1)
+                    for s, t in endpoints
+                ],
+                dtype=np.int64
+            )
+            _edge_drawer()(canvas, max_x, coords)
         
         # Draw nodes
         for node in self.graph.nodes:
-            self._draw_node(canvas, node, node.id == self.selected_node_id)
+            self._draw_node(canvas, max_x, node, node.id == self.selected_node_id)
         
         # Convert canvas to strings
-        return [''.join(row).rstrip() for row in canvas]
+        text = canvas.tobytes().decode(_CELL_CODEC)
+        self._drawn_lines = [text[i:i + max_x].rstrip() for i in range(0, len(text), max_x)]
+        self._drawn_graph = self.graph
+        self._drawn_key = (self.graph.version, max_x, size)
+        self._drawn_selected = self.selected_node_id
+        self._dirty_nodes.clear()
+        return self._drawn_lines
     
-    def _draw_node(self, canvas: list[list[str]], node: Node, selected: bool):
+    def _redraw_nodes(self) -> list[str]:
+        """Redraw dirty nodes over the existing canvas; only their rows are re-decoded.
+        
+        A node drawn later that overlaps a redrawn box is redrawn after it, so
+        the result matches drawing the whole graph again.
+        """
+        _, stride, size = self._drawn_key
+        canvas = self._canvas_buf[:size]
+        
+        dirty = set(self._dirty_nodes)
+        if self._drawn_selected != self.selected_node_id:
+            dirty.update(i for i in (self._drawn_selected, self.selected_node_id) if i)
+        self._dirty_nodes.clear()
+        self._drawn_selected = self.selected_node_id
+        
+        boxes: list[Tuple[int, int]] = []
+        rows: Set[int] = set()
+        for node in self.graph.nodes:
+            x, y = node.position.x, node.position.y
+            if node.id in dirty or any(
+                abs(x - bx) < _NODE_WIDTH and abs(y - by) < _NODE_HEIGHT for bx, by in boxes
+            ):
+                self._draw_node(canvas, stride, node, node.id == self.selected_node_id)
+                boxes.append((x, y))
+                rows.update(range(y, y + _NODE_HEIGHT))
+        
+        lines = self._drawn_lines
+        for row in rows:
+            if 0 <= row < len(lines):
+                lines[row] = canvas[row * stride:(row + 1) * stride].tobytes().decode(_CELL_CODEC).rstrip()
+        return lines
+    
+    def mark_nodes_dirty(self, node_ids: Iterable[str]):
+        """Redraw just these nodes on the next render, e.g. after status updates."""
+        self._dirty_nodes.update(node_ids)
+        self.refresh()
+    
+    def _draw_node(self, canvas: np.ndarray, stride: int, node: Node, selected: bool):
         """Draw a node on the canvas."""
         x, y = node.position.x, node.position.y
-        width = 20
-        height = 3
+        width = _NODE_WIDTH
+        height = _NODE_HEIGHT
+        top_row, bottom_row, side = _BOX_TEMPLATES[selected]
         
-        # Choose style based on status
-        if selected:
-            corners = ('╔', '╗', '╚', '╝')
-            h_line, v_line = '═', '║'
-            style = 'selected'
-        else:
-            corners = ('┌', '┐', '└', '┘')
-            h_line, v_line = '─', '│'
-            style = node.status.value
+        top = y * stride + x
+        bottom = (y + height - 1) * stride + x
+        if top < 0 or bottom + width > len(canvas):
+            return  # Node is outside canvas bounds
         
-        # Draw box
-        try:
-            # Top
-            canvas[y][x] = corners[0]
-            for i in range(1, width - 1):
-                canvas[y][x + i] = h_line
-            canvas[y][x + width - 1] = corners[1]
-            
-            # Sides
-            for i in range(1, height - 1):
-                canvas[y + i][x] = v_line
-                canvas[y + i][x + width - 1] = v_line
-            
-            # Bottom
-            canvas[y + height - 1][x] = corners[2]
-            for i in range(1, width - 1):
-                canvas[y + height - 1][x + i] = h_line
-            canvas[y + height - 1][x + width - 1] = corners[3]
-            
-            # Node name (truncated)
-            name = node.name[:width - 4]
-            name_x = x + (width - len(name)) // 2
-            for i, char in enumerate(name):
-                canvas[y + 1][name_x + i] = char
-            
-            # Status indicator
-            status_char = self._get_status_char(node.status)
-            canvas[y + 1][x + 1] = status_char
-            
-        except IndexError:
-            pass  # Node is outside canvas bounds
-    
-    def _draw_edge(self, canvas: list[list[str]], source: Node, target: Node):
-        """Draw an edge between two nodes."""
-        # Simple line from source to target
-        x1, y1 = source.position.x + 10, source.position.y + 1
-        x2, y2 = target.position.x, target.position.y + 1
+        # Draw box; the interior is left as is, like the edges drawn under it
+        canvas[top:top + width] = top_row
+        for i in range(1, height - 1):
+            canvas[top + i * stride] = side
+            canvas[top + i * stride + width - 1] = side
+        canvas[bottom:bottom + width] = bottom_row
         
-        try:
-            # Vertical line
-            if x1 == x2:
-                for y in range(min(y1, y2), max(y1, y2) + 1):
-                    if canvas[y][x1] == ' ':
-                        canvas[y][x1] = '│'
-            # Horizontal line
-            elif y1 == y2:
-                for x in range(min(x1, x2), max(x1, x2) + 1):
-                    if canvas[y1][x] == ' ':
-                        canvas[y1][x] = '─'
-            # L-shaped connection
-            else:
-                # Horizontal part
-                for x in range(x1, x2):
-                    if canvas[y1][x] == ' ':
-                        canvas[y1][x] = '─'
-                # Vertical part
-                for y in range(min(y1, y2), max(y1, y2) + 1):
-                    if canvas[y][x2] == ' ':
-                        canvas[y][x2] = '│'
-                # Corner
-                canvas[y1][x2] = '└' if y2 > y1 else '┘'
-            
-            # Arrow at target
-            if x2 < len(canvas[y2]):
-                canvas[y2][x2] = '►'
-        except IndexError:
-            pass
+        # Node name (truncated)
+        name = node.name[:width - 4]
+        name_x = x + (width - len(name)) // 2
+        start = (y + 1) * stride + name_x
+        canvas[start:start + len(name)] = _encode(name)
+        
+        # Status indicator
+        status_char = self._get_status_char(node.status)
+        canvas[top + stride + 1] = ord(status_char)
     
     def _get_status_char(self, status: NodeStatus) -> str:
         """Get character for node status."""
-        return {
-            NodeStatus.PENDING: '○',
-            NodeStatus.RUNNING: '◐',
-            NodeStatus.SUCCESS: '●',
-            NodeStatus.FAILURE: '✗',
-            NodeStatus.SKIPPED: '⊘',
-        }.get(status, '?')
+        return _STATUS_CHARS.get(status, '?')
     
     def set_graph(self, graph: Graph):
         """Set the graph to display."""
@@ -209,15 +375,10 @@ class GraphCanvas(Static):
             return
         
         if not self.selected_node_id:
-            self.select_node(self.graph.nodes[0].id)
+            self._select_index(0)
             return
         
-        current_idx = next(
-            (i for i, n in enumerate(self.graph.nodes) if n.id == self.selected_node_id),
-            -1
-        )
-        next_idx = (current_idx + 1) % len(self.graph.nodes)
-        self.select_node(self.graph.nodes[next_idx].id)
+        self._select_index((self._current_index() + 1) % len(self.graph.nodes))
     
     def select_prev_node(self):
         """Select previous node."""
@@ -225,15 +386,27 @@ class GraphCanvas(Static):
             return
         
         if not self.selected_node_id:
-            self.select_node(self.graph.nodes[-1].id)
+            self._select_index(len(self.graph.nodes) - 1)
             return
         
-        current_idx = next(
-            (i for i, n in enumerate(self.graph.nodes) if n.id == self.selected_node_id),
+        self._select_index((self._current_index() - 1) % len(self.graph.nodes))
+    
+    def _current_index(self) -> int:
+        """Position of the selected node in graph.nodes, or -1."""
+        nodes = self.graph.nodes
+        idx = self._selected_idx
+        if 0 <= idx < len(nodes) and nodes[idx].id == self.selected_node_id:
+            return idx
+        # Selection came from elsewhere or the node list changed
+        return next(
+            (i for i, n in enumerate(nodes) if n.id == self.selected_node_id),
             -1
         )
-        prev_idx = (current_idx - 1) % len(self.graph.nodes)
-        self.select_node(self.graph.nodes[prev_idx].id)
+    
+    def _select_index(self, idx: int):
+        """Select the node at idx in graph.nodes."""
+        self.select_node(self.graph.nodes[idx].id)
+        self._selected_idx = idx
     
     def get_selected_node(self) -> Optional[Node]:
         """Get currently selected node."""
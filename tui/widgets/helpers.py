@@ -1,8 +1,9 @@
 """Supporting widgets for Graph TUI."""
 
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from textual.app import ComposeResult
 from textual.widgets import Static, Tree, Label, Input, Button
+from textual.widgets.tree import TreeNode
 from textual.containers import Container, Vertical, Horizontal
 from textual.reactive import reactive
 from textual.screen import ModalScreen
@@ -13,6 +14,15 @@ from rich.panel import Panel
 from graph_tui.models import Graph, Node, Execution, NodeStatus
 
 
+_STATUS_ICONS = {
+    NodeStatus.PENDING: "○",
+    NodeStatus.RUNNING: "◐",
+    NodeStatus.SUCCESS: "●",
+    NodeStatus.FAILURE: "✗",
+    NodeStatus.SKIPPED: "⊘",
+}
+
+
 # === Node List Widget ===
 
 class NodeList(Static):
@@ -29,14 +39,40 @@ class NodeList(Static):
     graph: reactive[Optional[Graph]] = reactive(None)
     selected_node_id: reactive[Optional[str]] = reactive(None)
     
+    def __init__(self, *args, **kwargs):
+        """Initialize node list."""
+        super().__init__(*args, **kwargs)
+        # node id -> its tree entries (one per parent path) and current label
+        self._tree_nodes: Dict[str, List[TreeNode]] = {}
+        self._labels: Dict[str, str] = {}
+        self._tree_shape: Optional[Tuple] = None
+    
     def compose(self) -> ComposeResult:
         """Compose widget."""
         yield Tree("Nodes")
     
     def watch_graph(self, graph: Optional[Graph]):
-        """Update tree when graph changes."""
+        """Update tree when graph changes.
+        
+        When the node hierarchy is unchanged, e.g. during execution where only
+        statuses move, just the labels that differ are updated in place.
+        """
         tree = self.query_one(Tree)
+        shape = self._graph_shape(graph) if graph else None
+        
+        if graph and shape == self._tree_shape:
+            for node in graph.nodes:
+                label = self._node_label(node)
+                if self._labels.get(node.id) != label:
+                    self._labels[node.id] = label
+                    for tree_node in self._tree_nodes.get(node.id, ()):
+                        tree_node.set_label(label)
+            return
+        
         tree.clear()
+        self._tree_nodes = {}
+        self._labels = {}
+        self._tree_shape = shape
         
         if not graph:
             return
@@ -47,12 +83,22 @@ class NodeList(Static):
         for node in graph.get_root_nodes():
             self._add_node_tree(tree.root, node, graph)
     
+    def _graph_shape(self, graph: Graph) -> Tuple:
+        """Everything that decides the tree's structure, for change detection."""
+        return tuple((node.id, not node.parent_ids, tuple(node.child_ids)) for node in graph.nodes)
+    
+    def _node_label(self, node: Node) -> str:
+        """Tree label for a node."""
+        status_icon = self._get_status_icon(node.status)
+        return f"{status_icon} {node.name}"
+    
     def _add_node_tree(self, parent, node: Node, graph: Graph):
         """Recursively add nodes to tree."""
-        status_icon = self._get_status_icon(node.status)
-        label = f"{status_icon} {node.name}"
+        label = self._node_label(node)
         
         node_tree = parent.add(label, data=node.id)
+        self._tree_nodes.setdefault(node.id, []).append(node_tree)
+        self._labels[node.id] = label
         
         # Add children
         for child in graph.get_children(node.id):
@@ -60,13 +106,7 @@ class NodeList(Static):
     
     def _get_status_icon(self, status: NodeStatus) -> str:
         """Get icon for status."""
-        return {
-            NodeStatus.PENDING: "○",
-            NodeStatus.RUNNING: "◐",
-            NodeStatus.SUCCESS: "●",
-            NodeStatus.FAILURE: "✗",
-            NodeStatus.SKIPPED: "⊘",
-        }.get(status, "?")
+        return _STATUS_ICONS.get(status, "?")
     
     def set_graph(self, graph: Graph):
         """Set graph."""
@@ -88,6 +128,12 @@ class PropertyPanel(Static):
     
     node: reactive[Optional[Node]] = reactive(None)
     
+    def __init__(self, *args, **kwargs):
+        """Initialize panel."""
+        super().__init__(*args, **kwargs)
+        self._last_render_key: Optional[tuple] = None
+        self._last_panel: Optional[Panel] = None
+    
     def render(self):
         """Render properties."""
         if not self.node:
@@ -97,6 +143,16 @@ class PropertyPanel(Static):
                 border_style="blue"
             )
         
+        # Reuse the last panel while every displayed field is unchanged
+        node = self.node
+        key = (
+            node.id, node.name, node.type, node.status, node.description,
+            node.position.x, node.position.y,
+            len(node.parent_ids), len(node.child_ids), node.error_message,
+        )
+        if key == self._last_render_key:
+            return self._last_panel
+        
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Key", style="bold cyan")
         table.add_column("Value")
@@ -120,7 +176,9 @@ class PropertyPanel(Static):
         if self.node.error_message:
             table.add_row("Error", Text(self.node.error_message, style="red"))
         
-        return Panel(table, title="Properties", border_style="blue")
+        self._last_panel = Panel(table, title="Properties", border_style="blue")
+        self._last_render_key = key
+        return self._last_panel
     
     def set_node(self, node: Optional[Node]):
         """Set node to display."""